@@ -27,108 +27,298 @@ __build_name__ = "Block Manager - Delete Auto-Stop + Alert on Match Rescan"
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, Pango, Gdk
+from gi.repository import Gtk, GLib, Pango, Gdk, GObject
 import cairo
 import subprocess
 import threading
+import time
 import os
 import re
+import bisect
+import heapq
+import operator
 import json
+import hashlib
+import logging
 import sqlite3
 import requests
-from bs4 import BeautifulSoup
+from collections import deque
+from itertools import accumulate
 from datetime import datetime, timedelta
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Pool page tokens, matched in one pass over the raw (undecoded) HTML bytes:
+#   group 1: range IDs (format: 50XA1EC - 4 to 5 hex digits after X)
+#            NOTE: Pool format uses 4-5 chars, not 6! Matching 6 picks up extra digits.
+#   group 2: completed challenges (✅7FXXXXX format, ✅ as UTF-8)
+_POOL_TOKEN_RE = re.compile(
+    rb'([0-9A-F]{2}X[0-9A-F]{4,5})|' + '✅'.encode('utf-8') + rb'([0-9A-F]{2})XXXXX'
+)
+
+# Manual range line "START:END", "START-END" or "START END" (optional 0x prefixes)
+_MANUAL_RANGE_RE = re.compile(
+    r'(?:0[xX])?([0-9A-Fa-f]+)(?:\s*[:-]\s*| +)(?:0[xX])?([0-9A-Fa-f]+)'
+)
+
+# KeyHunt status line fields, e.g. "[T: 1,234,567] [226.51 Mk/s]" - one scan per line
+_KEYHUNT_STAT_RE = re.compile(r'(?P<speed>[\d.]+)\s*Mk/s|T:\s*(?P<keys>[\d,]+)')
+
+# Single-field KeyHunt patterns for process_output_line, and the puzzle combo label
+_KEYHUNT_SPEED_RE = re.compile(r'([\d.]+)\s*[MK]k/s')
+_KEYHUNT_KEYS_RE = re.compile(r'T:\s*([\d,]+)')
+_PUZZLE_LABEL_RE = re.compile(r'#(\d+)')
+
+# Block boundaries are stored as (hi, lo) INTEGER pairs; lo must stay below 2^63
+KEY_LO_BITS = 60
+KEY_LO_MASK = (1 << KEY_LO_BITS) - 1
+
+# KeyHunt --gpux grid: default, autotune candidates, probe time and per-GPU cache
+GPUX_DEFAULT = '256,256'
+GPUX_CANDIDATES = [f'{gx},{gy}' for gx in (128, 256, 384, 512) for gy in (128, 256, 512)]
+GPUX_PROBE_SECONDS = 10
+GPUX_CACHE_FILE = 'gpux_cache.json'
+
+
+# _NIBBLE_ONES[n] = 0x11...1 with n digits, covering any key up to 256 bits
+_NIBBLE_ONES = [((1 << (digits * 4)) - 1) // 15 for digits in range(65)]
+
+
+def _nibble_ones(key):
+    """0x11...1 with one bit per hex digit of key (at least one digit)"""
+    digits = (key.bit_length() + 3) >> 2
+    if digits < len(_NIBBLE_ONES):
+        return _NIBBLE_ONES[digits or 1]
+    return ((1 << (digits * 4)) - 1) // 15
+
+
+def _query_gpu_uuid(gpu_id):
+    """UUID of an NVIDIA GPU by device index, or None without nvidia-smi"""
+    try:
+        output = subprocess.run(
+            ['nvidia-smi', '--query-gpu=index,uuid', '--format=csv,noheader'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    for line in output.splitlines():
+        index, _, uuid = line.partition(',')
+        if index.strip() == str(gpu_id).strip():
+            return uuid.strip()
+    return None
+
+
+def _iter_pipe_lines(pipe, chunk_size=65536):
+    """Yield decoded lines from an unbuffered binary pipe, read in large chunks
+    
+    Splits on CR as well as LF, like text-mode universal newlines - KeyHunt
+    redraws its status line with carriage returns.
+    """
+    pending = b''
+    while True:
+        chunk = pipe.read(chunk_size)  # One read() call - returns what's available
+        if not chunk:
+            break
+        
+        lines = (pending + chunk).replace(b'\r', b'\n').split(b'\n')
+        pending = lines.pop()  # Incomplete tail waits for the next chunk
+        for line in lines:
+            yield line.decode('utf-8', 'replace')
+    
+    if pending:
+        yield pending.decode('utf-8', 'replace')
+
+
 class PoolScraper:
     """Scrapes btcpuzzle.info for already-scanned ranges"""
     
     def __init__(self, puzzle_number=71):
         self.puzzle_number = puzzle_number
+        # Reused across scrapes so the TCP/TLS connection is kept alive
+        self.session = requests.Session()
+        
+        # Conditional GET validators + last result: URL -> (etag, last_modified, blocks)
+        self.validators = {}
+        
         self.update_puzzle(puzzle_number)
     
+    @staticmethod
+    def page_url(puzzle_number):
+        """Pool page URL for a puzzle"""
+        return f"https://btcpuzzle.info/puzzle/{puzzle_number}"
+    
+    @staticmethod
+    def decode_cache_path(puzzle_number):
+        """Decode cache file for a puzzle"""
+        return f"scrape_cache_puzzle_{puzzle_number}.json"
+    
     def update_puzzle(self, puzzle_number):
         """Update to different puzzle"""
         self.puzzle_number = puzzle_number
-        self.base_url = f"https://btcpuzzle.info/puzzle/{puzzle_number}"
+        self.base_url = self.page_url(puzzle_number)
+        
+        # Last decoded result, keyed by the page's range IDs + challenges
+        self.decode_cache_file = self.decode_cache_path(puzzle_number)
+        
+    def scrape_scanned_ranges(self, puzzle_number=None):
+        """Scrape currently scanned ranges from pool (default: the current puzzle)"""
+        # Fixed for the whole scrape - update_puzzle() may run on the main
+        # loop mid-fetch, and must not get this page's validators or blocks
+        if puzzle_number is None:
+            puzzle_number = self.puzzle_number
+        base_url = self.page_url(puzzle_number)
+        decode_cache_file = self.decode_cache_path(puzzle_number)
         
-    def scrape_scanned_ranges(self):
-        """Scrape currently scanned ranges from pool"""
         try:
-            print(f"\n{'='*80}")
-            print(f"🌐 POOL SCRAPER - LIVE DATA FETCH")
-            print(f"{'='*80}")
-            print(f"📍 URL: {self.base_url}")
-            print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"🔍 Fetching data from btcpuzzle.info...")
-            
-            response = requests.get(self.base_url, timeout=30)
-            response.raise_for_status()
+            logger.info("\n%s", '=' * 80)
+            logger.info("🌐 POOL SCRAPER - LIVE DATA FETCH")
+            logger.info("%s", '=' * 80)
+            logger.info("📍 URL: %s", base_url)
+            logger.info("⏰ Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("🔍 Fetching data from btcpuzzle.info...")
             
-            print(f"✅ HTTP Status: {response.status_code}")
-            print(f"📦 Response Size: {len(response.text):,} bytes")
+            # Ask the server to skip the body if the page hasn't changed
+            last_etag, last_modified, last_blocks = self.validators.get(base_url, (None, None, []))
+            headers = {}
+            if last_etag:
+                headers['If-None-Match'] = last_etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self.session.get(base_url, headers=headers, timeout=30)
             
-            # Extract range IDs (format: 50XA1EC - 4 to 5 hex digits after X)
-            # NOTE: Pool format uses 4-5 chars, not 6! Matching 6 picks up extra digits.
-            range_pattern = re.compile(r'[0-9A-F]{2}X[0-9A-F]{4,5}')
-            text_content = soup.get_text()
-            matches = range_pattern.findall(text_content)
+            if response.status_code == 304:
+                logger.info("♻️  HTTP 304 Not Modified - reusing %d blocks from last scrape", len(last_blocks))
+                logger.info("%s\n", '=' * 80)
+                return list(last_blocks)
             
-            print(f"🔢 Found {len(matches)} total range IDs (including duplicates)")
-            unique_ranges = set(matches)
-            print(f"🎯 Unique range IDs: {len(unique_ranges)}")
+            response.raise_for_status()
             
-            # Extract completed challenges (✅7FXXXXX format)
-            challenge_pattern = re.compile(r'✅([0-9A-F]{2})XXXXX')
-            challenge_matches = challenge_pattern.findall(text_content)
-            unique_challenges = set(challenge_matches)
+            logger.info("✅ HTTP Status: %d", response.status_code)
+            logger.info("📦 Response Size: %s bytes", f"{len(response.content):,}")
             
-            if unique_challenges:
-                print(f"\n🏆 Found {len(unique_challenges)} completed challenges")
-                print(f"   Challenges: {', '.join(sorted(unique_challenges))}")
+            # Range IDs and challenges appear verbatim in the HTML, so scan
+            # the raw bytes instead of decoding the page or building a DOM
+            range_count = 0
+            range_tokens = set()
+            challenge_tokens = set()
+            for range_id, challenge_prefix in _POOL_TOKEN_RE.findall(response.content):
+                if range_id:
+                    range_count += 1
+                    range_tokens.add(range_id)
+                else:
+                    challenge_tokens.add(challenge_prefix)
             
-            # Show first 10 examples
-            print(f"\n📋 Example Range IDs from website:")
-            for i, range_id in enumerate(sorted(unique_ranges)[:10]):
-                print(f"   {i+1}. {range_id}")
-            if len(unique_ranges) > 10:
-                print(f"   ... and {len(unique_ranges) - 10} more")
+            # Only the unique tokens need decoding to str
+            unique_ranges = {token.decode('ascii') for token in range_tokens}
+            unique_challenges = {token.decode('ascii') for token in challenge_tokens}
             
-            scanned_blocks = []
+            logger.info("🔢 Found %d total range IDs (including duplicates)", range_count)
+            logger.info("🎯 Unique range IDs: %d", len(unique_ranges))
             
-            # Decode regular ranges
-            for range_id in unique_ranges:
-                blocks = self._decode_range_id(range_id)
-                scanned_blocks.extend(blocks)
+            if unique_challenges:
+                logger.info("\n🏆 Found %d completed challenges", len(unique_challenges))
+                logger.info("   Challenges: %s", ', '.join(sorted(unique_challenges)))
+            
+            # Show first 10 examples (debug only)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n📋 Example Range IDs from website:")
+                for i, range_id in enumerate(heapq.nsmallest(10, unique_ranges)):
+                    logger.debug("   %d. %s", i + 1, range_id)
+                if len(unique_ranges) > 10:
+                    logger.debug("   ... and %d more", len(unique_ranges) - 10)
+            
+            # Same IDs as a previous scrape decode to the same blocks
+            cache_key = hashlib.sha1(
+                (','.join(sorted(unique_ranges)) + '|' + ','.join(sorted(unique_challenges))).encode('ascii')
+            ).hexdigest()
+            scanned_blocks = self._load_decode_cache(decode_cache_file, cache_key)
             
-            # Decode challenges  
-            for challenge_prefix in unique_challenges:
-                blocks = self._decode_challenge(challenge_prefix)
-                scanned_blocks.extend(blocks)
+            if scanned_blocks is None:
+                # Set drops blocks repeated across range IDs and challenges
+                scanned_blocks = set()
+                
+                # Decode regular ranges. A challenge only spans the sparse
+                # PP??000 blocks of its prefix, so the one range ID shape it
+                # fully covers is PPXs000 - every other ID still adds keyspace.
+                for range_id in unique_ranges:
+                    if (len(range_id) == 7 and range_id.endswith('000')
+                            and range_id[:2] in unique_challenges):
+                        continue
+                    scanned_blocks.update(self._decode_range_id(range_id))
+                
+                # Decode challenges  
+                for challenge_prefix in unique_challenges:
+                    scanned_blocks.update(self._decode_challenge(challenge_prefix))
+                
+                scanned_blocks = self._collapse_blocks(scanned_blocks)
+                self._save_decode_cache(decode_cache_file, cache_key, scanned_blocks)
+            else:
+                logger.info("\n♻️  Range IDs unchanged - loaded decoded blocks from %s", decode_cache_file)
             
-            print(f"\n🔢 Total blocks after expansion: {len(scanned_blocks)}")
-            print(f"   Regular ranges: {len(unique_ranges)} IDs × 16 = {len(unique_ranges) * 16} blocks")
-            print(f"   Challenges: {len(unique_challenges)} × 256 = {len(unique_challenges) * 256} blocks")
+            expanded_count = len(unique_ranges) * 16 + len(unique_challenges) * 256
+            logger.info("\n🔢 Total blocks after expansion: %d", expanded_count)
+            logger.info("   Regular ranges: %d IDs × 16 = %d blocks", len(unique_ranges), len(unique_ranges) * 16)
+            logger.info("   Challenges: %d × 256 = %d blocks", len(unique_challenges), len(unique_challenges) * 256)
+            logger.info("   After removing duplicate/contained blocks: %d", len(scanned_blocks))
             
             # Show first few expanded blocks
-            print(f"\n📊 Example Expanded Blocks:")
-            for i, (start, end) in enumerate(scanned_blocks[:5]):
-                print(f"   {i+1}. 0x{start:X} → 0x{end:X}")
-            if len(scanned_blocks) > 5:
-                print(f"   ... and {len(scanned_blocks) - 5} more")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n📊 Example Expanded Blocks:")
+                for i, (start, end) in enumerate(scanned_blocks[:5]):
+                    logger.debug("   %d. 0x%X → 0x%X", i + 1, start, end)
+                if len(scanned_blocks) > 5:
+                    logger.debug("   ... and %d more", len(scanned_blocks) - 5)
+            
+            logger.info("%s\n", '=' * 80)
             
-            print(f"{'='*80}\n")
+            # Remember validators only once the page has been fully processed -
+            # under the URL fetched, whatever puzzle is selected by now
+            self.validators[base_url] = (response.headers.get('ETag'),
+                                         response.headers.get('Last-Modified'),
+                                         scanned_blocks)
             
             return scanned_blocks
             
         except Exception as e:
-            print(f"❌ Pool scrape error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Pool scrape error: %s", e)
             return []
     
+    def _load_decode_cache(self, cache_file, cache_key):
+        """Return cached decoded blocks for this key, or None"""
+        try:
+            if os.path.exists(cache_file):
+                with open(cache_file, 'r') as f:
+                    cache = json.load(f)
+                if cache.get('key') == cache_key:
+                    return [tuple(block) for block in cache['blocks']]
+        except Exception as e:
+            logger.warning("Error loading decode cache: %s", e)
+        return None
+    
+    def _save_decode_cache(self, cache_file, cache_key, blocks):
+        """Save decoded blocks (only the latest result is kept)"""
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump({'key': cache_key, 'blocks': blocks}, f)
+        except Exception as e:
+            logger.warning("Error saving decode cache: %s", e)
+    
+    def _collapse_blocks(self, blocks):
+        """Sort blocks and drop any that repeat or sit inside an earlier block
+        
+        Distinct neighbouring blocks are NOT fused: pool blocks are matched
+        by exact (start, end) against BlockManager blocks and the current block.
+        """
+        collapsed = []
+        for block_start, block_end in sorted(blocks):
+            if collapsed and block_end <= collapsed[-1][1]:
+                continue  # Sorted by start, so this one is fully covered
+            collapsed.append((block_start, block_end))
+        return collapsed
+    
     def _decode_range_id(self, range_id):
         """Decode pool range ID to actual hex blocks
         
@@ -139,16 +329,21 @@ class PoolScraper:
         Expands to: PP + [0-F] + SUFFIX + 3000000000
         Result: 18 hex digits total
         """
-        # Remove X and expand
+        # Shift parsed digits into place instead of re-parsing an 18-digit
+        # string per block. Tail "3000000000" -> "3FFFFFFFFF" is the low 40 bits.
         hex_prefix = range_id[0:2]
         hex_suffix = range_id[3:]  # Will be 4 or 5 chars
+        suffix_shift = len(hex_suffix) * 4 + 40
+        
+        base = ((int(hex_prefix, 16) << (suffix_shift + 4)) |
+                (int(hex_suffix, 16) << 40) |
+                0x3000000000)
         
         blocks = []
-        for x in '0123456789ABCDEF':
+        for x in range(16):
             # Format: PP + X + SUFFIX + 3000000000 = 18 chars
-            block_start = int(hex_prefix + x + hex_suffix + '3000000000', 16)
-            block_end = int(hex_prefix + x + hex_suffix + '3FFFFFFFFF', 16)
-            blocks.append((block_start, block_end))
+            block_start = base | (x << suffix_shift)
+            blocks.append((block_start, block_start | 0xFFFFFFFFF))
         
         return blocks
     
@@ -158,15 +353,15 @@ class PoolScraper:
         A challenge like "7FXXXXX" covers ALL ranges starting with 7F.
         We expand this to 256 blocks (16×16) to cover the space efficiently.
         """
+        # Format: 7F + 00 + 000 + 3000000000 (17 hex digits)
+        base = (int(challenge_prefix, 16) << 60) | 0x3000000000
+        
         blocks = []
         
         # Expand 7FXXXXX to 7F00XXX, 7F01XXX, ... 7FFFXXX
-        for x1 in '0123456789ABCDEF':
-            for x2 in '0123456789ABCDEF':
-                # Format: 7F + 00 + 000 + 3000000000
-                block_start = int(challenge_prefix + x1 + x2 + '0003000000000', 16)
-                block_end = int(challenge_prefix + x1 + x2 + '0003FFFFFFFFF', 16)
-                blocks.append((block_start, block_end))
+        for x in range(256):
+            block_start = base | (x << 52)
+            blocks.append((block_start, block_start | 0xFFFFFFFFF))
         
         return blocks
 
@@ -200,152 +395,485 @@ class BlockManager:
         return block_index
 
 
+class BlockIntervals:
+    """Sorted keyspace intervals stored as parallel start/end lists
+    
+    Overlapping and adjacent blocks are merged, so both lists are strictly
+    increasing and range queries reduce to bisect + prefix sums.
+    """
+    
+    def __init__(self, blocks=()):
+        self.starts = []
+        self.ends = []
+        for block_start, block_end in sorted(blocks):
+            if self.ends and block_start <= self.ends[-1] + 1:
+                if block_end > self.ends[-1]:
+                    self.ends[-1] = block_end
+            else:
+                self.starts.append(block_start)
+                self.ends.append(block_end)
+        
+        # key_totals[i] = keys covered by the first i intervals
+        #               = sum(end - start) over them + i
+        # built entirely from C-level iterators, no per-interval bytecode
+        self.key_totals = list(map(operator.add,
+                                   accumulate(map(operator.sub, self.ends, self.starts), initial=0),
+                                   range(len(self.starts) + 1)))
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def overlapping(self, range_start, range_end):
+        """Index slice [first, last) of the intervals overlapping [range_start, range_end]
+        
+        O(log N) - callers then touch only the k overlapping intervals.
+        """
+        return (bisect.bisect_left(self.ends, range_start),
+                bisect.bisect_right(self.starts, range_end))
+    
+    @property
+    def total_keys(self):
+        """Keys covered by all intervals together"""
+        return self.key_totals[-1]
+    
+    def covered_keys(self, range_start, range_end):
+        """Count keys in [range_start, range_end] covered by these intervals"""
+        # Common case: the view spans every interval (e.g. full keyspace)
+        if not self.starts or (range_start <= self.starts[0] and range_end >= self.ends[-1]):
+            return self.total_keys
+        
+        first, last = self.overlapping(range_start, range_end)
+        if first >= last:
+            return 0
+        
+        covered = self.key_totals[last] - self.key_totals[first]
+        
+        # Trim the parts of the edge intervals that stick out of the range
+        if self.starts[first] < range_start:
+            covered -= range_start - self.starts[first]
+        if self.ends[last - 1] > range_end:
+            covered -= self.ends[last - 1] - range_end
+        
+        return covered
+    
+    def pixel_runs(self, display_start, display_end, width):
+        """Map intervals overlapping the display range to integer (x, width) pixel runs
+        
+        Intervals that land on the same or touching pixels are folded into a
+        single run, so the draw cost is bounded by the bar width rather than
+        the number of blocks. Whole-pixel edges let Cairo fill without
+        antialiasing.
+        """
+        total_range = display_end - display_start + 1
+        first, last = self.overlapping(display_start, display_end)
+        
+        # Zoomed out past one interval per pixel: probe each pixel column
+        # instead, so the cost no longer grows with the block count
+        if last - first > width:
+            return self._column_runs(display_start, display_end, width)
+        
+        # Pixels per key, hoisted so each block costs a float multiply rather
+        # than a correctly-rounded big-int true division
+        scale = width / total_range
+        
+        runs = []
+        for i in range(first, last):
+            # Clip to display range
+            visible_start = max(self.starts[i], display_start)
+            visible_end = min(self.ends[i], display_end)
+            
+            x_start = int((visible_start - display_start) * scale)
+            x_end = round((visible_end - display_start + 1) * scale)
+            x_end = max(x_end, x_start + 1)  # At least 1 pixel visible
+            
+            if runs and x_start <= runs[-1][1]:
+                if x_end > runs[-1][1]:
+                    runs[-1][1] = x_end
+            else:
+                runs.append([x_start, x_end])
+        
+        return [(x_start, x_end - x_start) for x_start, x_end in runs]
+    
+    def _column_runs(self, display_start, display_end, width):
+        """Pixel runs built from a per-column "any key covered?" probe"""
+        total_range = display_end - display_start + 1
+        runs = []
+        for x in range(width):
+            # Keys whose position floors to column x
+            col_start = display_start + (x * total_range + width - 1) // width
+            col_end = display_start + ((x + 1) * total_range + width - 1) // width - 1
+            if col_start > col_end:
+                continue  # Narrower range than bar - no key lands here
+            
+            i = bisect.bisect_left(self.ends, col_start)
+            if i < len(self.starts) and self.starts[i] <= col_end:
+                if runs and runs[-1][1] == x:
+                    runs[-1][1] = x + 1
+                else:
+                    runs.append([x, x + 1])
+        
+        return [(x_start, x_end - x_start) for x_start, x_end in runs]
+
+
 class ScanDatabase:
     """SQLite database for tracking scanned blocks"""
     
+    # Write statements as shared constants - one text per statement, so
+    # sqlite3's per-connection statement cache prepares each exactly once
+    INSERT_POOL_SQL = ('INSERT OR REPLACE INTO pool_scanned '
+                       '(start_hi, start_lo, end_hi, end_lo, scraped_at) '
+                       'VALUES (?, ?, ?, ?, ?)')
+    INSERT_MY_SQL = ('INSERT OR REPLACE INTO my_scanned '
+                     '(start_hi, start_lo, end_hi, end_lo, scanned_at, keys_checked) '
+                     'VALUES (?, ?, ?, ?, ?, ?)')
+    DELETE_MY_SQL = 'DELETE FROM my_scanned WHERE start_hi = ? AND start_lo = ?'
+    
     def __init__(self, puzzle_number=71):
         self.puzzle_number = puzzle_number
+        self._generation = 0  # Bumped after every change to the block index
+        self._scanned_runs = None  # (cache key, runs) of get_scanned_block_runs()
+        self._stats_cache = None  # (generation, stats) of get_stats()
+        self._write_lock = threading.Lock()  # GUI and scraper threads share self.conn
         self.db_path = f"scan_data_puzzle_{puzzle_number}.db"
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = self._connect()
+        self._read_cursor = self.conn.cursor()  # Reused by the bulk block reads
+        self._write_cursor = self.conn.cursor()  # Reused by writes, under _write_lock
         self._create_tables()
+        self._load_block_index()
     
     def switch_puzzle(self, puzzle_number):
         """Switch to a different puzzle database"""
-        # Close current connection
-        self.conn.close()
-        
-        # Open new database for new puzzle
-        self.puzzle_number = puzzle_number
-        self.db_path = f"scan_data_puzzle_{puzzle_number}.db"
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._create_tables()
+        # Held for the whole swap - a scraper batch never lands mid-switch
+        with self._write_lock:
+            # Close current connection
+            self._close_connection()
+            
+            # Open new database for new puzzle
+            self.puzzle_number = puzzle_number
+            self.db_path = f"scan_data_puzzle_{puzzle_number}.db"
+            self.conn = self._connect()
+            self._read_cursor = self.conn.cursor()  # Reused by the bulk block reads
+            self._write_cursor = self.conn.cursor()  # Reused by writes, under _write_lock
+            self._create_tables()
+            self._load_block_index()
+    
+    def _connect(self):
+        """Open the database in WAL mode so scraper writes don't block GUI reads"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')  # Safe under WAL, no fsync per commit
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # 20 MB page cache
+        conn.execute('PRAGMA busy_timeout=30000')  # Wait out other writers instead of failing
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB
+        return conn
     
     def _create_tables(self):
-        """Create database tables"""
+        """Create database tables, migrating legacy ones in a single transaction"""
+        # Explicit BEGIN/COMMIT: sqlite3 would otherwise autocommit the DDL
+        # statement by statement, and an interrupted migration lost the rows
+        self.conn.isolation_level = None
+        try:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._create_tables_in_transaction()
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+        finally:
+            self.conn.isolation_level = ''
+    
+    def _create_tables_in_transaction(self):
+        """Create (and migrate) the tables - caller holds an open transaction"""
         cursor = self.conn.cursor()
         
-        # Pool scanned blocks (store as TEXT hex to avoid integer overflow)
+        # Databases from v3.5.0 and earlier stored boundaries as hex TEXT
+        legacy_rows = self._detach_hex_tables()
+        
+        # Keys are up to ~75 bits, too wide for SQLite's signed 64-bit INTEGER,
+        # so each boundary is split into (hi, lo) integer columns
+        
+        # Pool scanned blocks
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS pool_scanned (
-                block_start TEXT PRIMARY KEY,
-                block_end TEXT,
-                scraped_at TEXT
+                start_hi INTEGER NOT NULL,
+                start_lo INTEGER NOT NULL,
+                end_hi INTEGER NOT NULL,
+                end_lo INTEGER NOT NULL,
+                scraped_at TEXT,
+                PRIMARY KEY (start_hi, start_lo)
             )
         ''')
         
-        # My scanned blocks (store as TEXT hex to avoid integer overflow)
+        # My scanned blocks
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS my_scanned (
-                block_start TEXT PRIMARY KEY,
-                block_end TEXT,
+                start_hi INTEGER NOT NULL,
+                start_lo INTEGER NOT NULL,
+                end_hi INTEGER NOT NULL,
+                end_lo INTEGER NOT NULL,
                 scanned_at TEXT,
-                keys_checked INTEGER
+                keys_checked INTEGER,
+                PRIMARY KEY (start_hi, start_lo)
             )
         ''')
         
-        self.conn.commit()
+        # Copy migrated rows into the new tables
+        if 'pool_scanned' in legacy_rows:
+            cursor.executemany(self.INSERT_POOL_SQL, legacy_rows['pool_scanned'])
+        
+        if 'my_scanned' in legacy_rows:
+            cursor.executemany(self.INSERT_MY_SQL, legacy_rows['my_scanned'])
+        
+        # Covering indexes: the ordered full-table reads behind the block
+        # cache and index are answered from the index alone
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_pool_blocks 
+            ON pool_scanned (start_hi, start_lo, end_hi, end_lo)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_my_blocks 
+            ON my_scanned (start_hi, start_lo, end_hi, end_lo, keys_checked)
+        ''')
     
-    def add_pool_blocks(self, blocks):
-        """Add pool-scanned blocks and return count of new blocks added"""
+    def _detach_hex_tables(self):
+        """Drop legacy hex TEXT tables and return their rows converted
+        
+        Also picks up *_hex tables left behind by an interrupted migration
+        from before the migration ran in one transaction.
+        """
         cursor = self.conn.cursor()
+        legacy_rows = {}
+        
+        for table in ('pool_scanned', 'my_scanned'):
+            rows = []
+            found = False
+            for source in (f'{table}_hex', table):
+                columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({source})')]
+                if 'block_start' not in columns:
+                    continue
+                
+                # block_start, block_end, then timestamp (+ keys_checked for my_scanned)
+                for block_start_hex, block_end_hex, *rest in cursor.execute(f'SELECT * FROM {source}').fetchall():
+                    rows.append(self._split(int(block_start_hex, 16)) +
+                                self._split(int(block_end_hex, 16)) +
+                                tuple(rest))
+                
+                # Rows are in memory and the drop commits with their copy
+                cursor.execute(f'DROP TABLE {source}')
+                found = True
+            
+            if found:
+                legacy_rows[table] = rows
+                logger.info("📦 Migrating %d %s rows from hex text to integer columns", len(rows), table)
+        
+        return legacy_rows
+    
+    def _load_block_index(self):
+        """Load block_start -> block_end maps so lookups don't hit SQLite"""
+        cursor = self._read_cursor
+        for table, attr in (('pool_scanned', '_pool_index'), ('my_scanned', '_my_index')):
+            cursor.execute(f'SELECT start_hi, start_lo, end_hi, end_lo FROM {table}')
+            setattr(self, attr, {(s_hi << KEY_LO_BITS) | s_lo: (e_hi << KEY_LO_BITS) | e_lo
+                                 for s_hi, s_lo, e_hi, e_lo in cursor})
+        self._generation += 1
+    
+    @staticmethod
+    def _split(key):
+        """Split a key into (hi, lo) halves that fit SQLite INTEGER"""
+        return (key >> KEY_LO_BITS, key & KEY_LO_MASK)
+    
+    @staticmethod
+    def _join(hi, lo):
+        """Rebuild a key from its (hi, lo) halves"""
+        return (hi << KEY_LO_BITS) | lo
+    
+    def add_pool_blocks(self, blocks, puzzle_number=None):
+        """Add pool-scanned blocks and return (added, duplicate) counts
+        
+        Pass the puzzle the blocks were scraped for: if the database has
+        switched to another puzzle since, nothing is written and None is
+        returned.
+        """
         timestamp = datetime.now().isoformat()
         
         added_count = 0
         duplicate_count = 0
         
-        for block_start, block_end in blocks:
-            # Convert to hex strings for storage
-            block_start_hex = hex(block_start)[2:].upper()  # Remove '0x' prefix
-            block_end_hex = hex(block_end)[2:].upper()
-            
-            # Check if block already exists
-            cursor.execute('''
-                SELECT COUNT(*) FROM pool_scanned 
-                WHERE block_start = ?
-            ''', (block_start_hex,))
-            exists = cursor.fetchone()[0] > 0
-            
-            if exists:
-                duplicate_count += 1
-            else:
-                added_count += 1
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO pool_scanned 
-                (block_start, block_end, scraped_at)
-                VALUES (?, ?, ?)
-            ''', (block_start_hex, block_end_hex, timestamp))
+        def rows():
+            # Streamed into executemany - no intermediate list of row tuples
+            nonlocal added_count, duplicate_count
+            for block_start, block_end in blocks:
+                known_end = self._pool_index.get(block_start)
+                if known_end is not None:
+                    duplicate_count += 1
+                    if known_end == block_end:
+                        continue  # Row already on disk - REPLACE would delete and rewrite it
+                else:
+                    added_count += 1
+                self._pool_index[block_start] = block_end
+                
+                yield (block_start >> KEY_LO_BITS, block_start & KEY_LO_MASK,
+                       block_end >> KEY_LO_BITS, block_end & KEY_LO_MASK,
+                       timestamp)
+        
+        # Single transaction for the whole batch
+        with self._write_lock:
+            if puzzle_number is not None and puzzle_number != self.puzzle_number:
+                return None
+            with self.conn:
+                self._write_cursor.executemany(self.INSERT_POOL_SQL, rows())
+        self._generation += 1
         
-        self.conn.commit()
         return added_count, duplicate_count
     
     def add_my_block(self, block_start, block_end, keys_checked):
         """Add my scanned block"""
-        cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
         
-        # Convert to hex strings for storage
-        block_start_hex = hex(block_start)[2:].upper()
-        block_end_hex = hex(block_end)[2:].upper()
+        # Own transaction - a commit here must never close the scraper's open batch
+        with self._write_lock, self.conn:
+            self._write_cursor.execute(self.INSERT_MY_SQL,
+                                       self._split(block_start) + self._split(block_end) +
+                                       (timestamp, keys_checked))
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO my_scanned 
-            (block_start, block_end, scanned_at, keys_checked)
-            VALUES (?, ?, ?, ?)
-        ''', (block_start_hex, block_end_hex, timestamp, keys_checked))
-        
-        self.conn.commit()
+        self._my_index[block_start] = block_end
+        self._generation += 1
     
-    def is_block_scanned(self, block_start, block_end):
-        """Check if block already scanned (by pool or me)"""
-        cursor = self.conn.cursor()
-        
-        # Convert to hex strings for comparison
-        block_start_hex = hex(block_start)[2:].upper()
-        block_end_hex = hex(block_end)[2:].upper()
+    def add_my_blocks(self, blocks, keys_checked=0):
+        """Add many of my scanned blocks in a single transaction"""
+        timestamp = datetime.now().isoformat()
+        rows = [self._split(block_start) + self._split(block_end) + (timestamp, keys_checked)
+                for block_start, block_end in blocks]
         
-        # Check pool
-        cursor.execute('''
-            SELECT COUNT(*) FROM pool_scanned 
-            WHERE block_start = ? AND block_end = ?
-        ''', (block_start_hex, block_end_hex))
+        # One statement prepare and one commit for the whole batch
+        with self._write_lock, self.conn:
+            self._write_cursor.executemany(self.INSERT_MY_SQL, rows)
         
-        if cursor.fetchone()[0] > 0:
-            return True, "pool"
+        self._my_index.update(blocks)
+        self._generation += 1
+    
+    def delete_my_block(self, block_start):
+        """Remove one of my scanned blocks so it can be rescanned"""
+        with self._write_lock, self.conn:
+            self._write_cursor.execute(self.DELETE_MY_SQL, self._split(block_start))
+        self._my_index.pop(block_start, None)
+        self._generation += 1
+    
+    def clear_pool_blocks(self):
+        """Remove all pool scanned blocks"""
+        with self._write_lock, self.conn:
+            self._write_cursor.execute('DELETE FROM pool_scanned')
+        self._pool_index.clear()
+        self._generation += 1
+    
+    def get_pool_blocks(self):
+        """Return all pool scanned blocks as sorted (start, end) integers"""
+        # Served from the in-memory index - no query, no per-row hi/lo rejoin
+        return sorted(self._pool_index.items())
+    
+    def get_my_blocks(self, with_keys=False):
+        """Return all my scanned blocks as sorted (start, end[, keys_checked]) integers"""
+        if not with_keys:
+            return sorted(self._my_index.items())
         
-        # Check my scans
+        # Step the cursor directly - no intermediate fetchall() list of raw rows
+        cursor = self._read_cursor
         cursor.execute('''
-            SELECT COUNT(*) FROM my_scanned 
-            WHERE block_start = ? AND block_end = ?
-        ''', (block_start_hex, block_end_hex))
+            SELECT start_hi, start_lo, end_hi, end_lo, keys_checked FROM my_scanned 
+            ORDER BY start_hi, start_lo
+        ''')
+        return [((s_hi << KEY_LO_BITS) | s_lo, (e_hi << KEY_LO_BITS) | e_lo, keys or 0)
+                for s_hi, s_lo, e_hi, e_lo, keys in cursor]
+    
+    def is_block_scanned(self, block_start, block_end):
+        """Check if block already scanned (by pool or me)"""
+        # In-memory lookup - kept in sync with every write below
+        if self._pool_index.get(block_start) == block_end:
+            return True, "pool"
         
-        if cursor.fetchone()[0] > 0:
+        if self._my_index.get(block_start) == block_end:
             return True, "me"
         
         return False, None
     
+    def get_scanned_block_runs(self, block_mgr):
+        """Runs of consecutive block_mgr indexes already scanned (by pool or me)
+        
+        Returns sorted parallel (firsts, lasts) lists, so a caller can bisect
+        straight past a whole run. Cached until the next write. Built on the
+        next-block worker thread - the index maps are snapshotted, not iterated.
+        """
+        key = (self._generation, block_mgr.range_start, block_mgr.range_end, block_mgr.block_size)
+        if self._scanned_runs and self._scanned_runs[0] == key:
+            return self._scanned_runs[1]
+        
+        # Same exact (start, end) match as is_block_scanned, mapped to indexes
+        indexes = set()
+        for index in (self._pool_index, self._my_index):
+            for block_start, block_end in list(index.items()):
+                block_index = block_mgr.get_block_from_key(block_start)
+                if block_index is not None and block_mgr.get_block(block_index) == (block_start, block_end):
+                    indexes.add(block_index)
+        
+        firsts = []
+        lasts = []
+        for block_index in sorted(indexes):
+            if lasts and block_index == lasts[-1] + 1:
+                lasts[-1] = block_index
+            else:
+                firsts.append(block_index)
+                lasts.append(block_index)
+        
+        self._scanned_runs = (key, (firsts, lasts))
+        return firsts, lasts
+    
+    def count_pool_blocks(self):
+        """Number of pool scanned blocks (same as COUNT(*), from the index)"""
+        return len(self._pool_index)
+    
+    def count_my_blocks(self):
+        """Number of my scanned blocks (same as COUNT(*), from the index)"""
+        return len(self._my_index)
+    
     def get_stats(self):
-        """Get scanning statistics"""
-        cursor = self.conn.cursor()
+        """Get scanning statistics (cached until the next write)"""
+        if self._stats_cache and self._stats_cache[0] == self._generation:
+            return self._stats_cache[1]
         
-        cursor.execute('SELECT COUNT(*) FROM pool_scanned')
-        pool_count = cursor.fetchone()[0]
+        generation = self._generation
+        cursor = self.conn.cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM my_scanned')
-        my_count = cursor.fetchone()[0]
+        pool_count = self.count_pool_blocks()
+        my_count = self.count_my_blocks()
         
         cursor.execute('SELECT SUM(keys_checked) FROM my_scanned')
         total_keys = cursor.fetchone()[0] or 0
         
-        return {
+        stats = {
             'pool_blocks': pool_count,
             'my_blocks': my_count,
             'total_blocks': pool_count + my_count,
             'total_keys_by_me': total_keys
         }
+        self._stats_cache = (generation, stats)
+        return stats
     
     def close(self):
         """Close database connection"""
+        # Never under a writer - the scraper thread may be mid-batch
+        with self._write_lock:
+            self._close_connection()
+    
+    def _close_connection(self):
+        """Optimize and close self.conn - caller holds _write_lock"""
+        # Refresh planner statistics (ANALYZE) for the indexes, if they've drifted -
+        # best effort, the connection is closed either way
+        try:
+            self.conn.execute('PRAGMA optimize')
+        except sqlite3.Error as e:
+            logger.warning("PRAGMA optimize skipped: %s", e)
         self.conn.close()
 
 
@@ -394,6 +922,25 @@ class StateManager:
 
 class KeyHuntSmartGUI(Gtk.Window):
     
+    # Probability dashboard rows: (title, initial value)
+    PROBABILITY_FACTORS = [
+        ("1. Search Space Coverage:", "0.00%"),
+        ("2. Pattern Optimization:", "None active"),
+        ("3. Pool Coordination:", "No data"),
+        ("4. Search Speed:", "0 Mk/s"),
+        ("5. Time Invested:", "00:00:00"),
+    ]
+    
+    # Reduction label markup for each (iter3, iter4, alphanum) toggle state -
+    # estimates add up (60/40/30%), capped at 95% since they can't combine additively
+    PATTERN_REDUCTION_MARKUP = {
+        (iter3, iter4, alphanum):
+            f"<span foreground='#00FFFF' weight='bold'>"
+            f"Estimated search space reduction: {min(60 * iter3 + 40 * iter4 + 30 * alphanum, 95)}%"
+            f"</span>"
+        for iter3 in (False, True) for iter4 in (False, True) for alphanum in (False, True)
+    }
+    
     # Puzzle presets with known information
     PUZZLE_PRESETS = {
         71: {
@@ -447,6 +994,14 @@ class KeyHuntSmartGUI(Gtk.Window):
         # Current puzzle
         self.current_puzzle = 71
         
+        # Console log lines waiting for the next idle flush
+        self.log_queue = deque()
+        self.log_flush_scheduled = False
+        
+        # Latest search widget values from the KeyHunt reader, applied at most 10x/s
+        self.search_ui_pending = {}
+        self.search_ui_scheduled = False
+        
         # Core components
         self.pool_scraper = PoolScraper(puzzle_number=self.current_puzzle)
         self.scan_db = ScanDatabase(puzzle_number=self.current_puzzle)
@@ -464,11 +1019,31 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.current_speed = 0
         self.current_block = None
         self.current_block_index = 0
-        
-        # CACHE: Store blocks to avoid constant DB queries on every redraw
-        self.cached_pool_blocks = []
-        self.cached_my_blocks = []
+        self.find_pending = False  # Next-block search in flight - never run two
+        self.find_on_found = None  # on_found of the search in flight
+        self.find_deferred = None  # on_found of a request made while one was in flight
+        self.find_interrupted = None  # on_found of a search cancelled by Pause, redone on Resume
+        self.find_generation = 0  # Bumped by Pause/Stop - older results are never claimed
+        self.gpu_uuids = {}  # GPU ID text -> UUID (None without nvidia-smi)
+        self.gpux_cache = self.load_gpux_cache()  # GPU UUID -> tuned --gpux grid
+        self.autotune_running = False
+        self.autotune_process = None  # KeyHunt probe currently running, if any
+        
+        # CACHE: Store merged blocks to avoid constant DB queries on every redraw
+        self.pool_intervals = BlockIntervals()
+        self.my_intervals = BlockIntervals()
         self.cache_dirty = True  # Flag to refresh cache
+        self.bar_runs_cache = {}  # (width, display range) -> pixel runs per layer
+        self.preset_ranges = {}  # puzzle number -> parsed (range_start, range_end)
+        self.coverage_stats_text = None  # Last markup pushed to coverage_stats_label
+        self.label_markup = {}  # Label -> last markup pushed by set_label_markup
+        self.keyhunt_dialog = None  # File choosers, created on first use and reused
+        self.import_dialog = None
+        self.bar_chrome_cache = {}  # bar name -> ((width, height), rendered ticks/labels)
+        self.current_block_area = None  # (block, bar width, x, width) painted by the current block
+        self.probability_cache = None  # (probability, time.monotonic() when computed)
+        self.display_range = None  # (inputs, result) of the last get_display_range()
+        self.refresh_pending = False  # Visualization refresh queued on idle
         
         # Thread safety - prevent starting multiple searches
         self.search_lock = threading.Lock()
@@ -479,8 +1054,12 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.total_keys_in_range = 0
         
         # Pool scraping
-        self.last_pool_scrape = None
+        self.last_pool_scrape = None  # time.monotonic() of the last scrape - drives the cadence
+        self.last_pool_scrape_wall = None  # datetime of the last scrape - display only
         self.scrape_interval = 60  # 1 hour in seconds
+        self._scraper_thread = None
+        self._scraper_stopped = False
+        self._scraper_wakeup = threading.Event()  # Set on manual scrape or shutdown
         
         # Load CSS
         self.apply_css()
@@ -492,8 +1071,9 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.load_previous_state()
         
         # Show pool data stats on startup
-        pool_count = len(self.scan_db.conn.execute('SELECT * FROM pool_scanned').fetchall())
-        my_count = len(self.scan_db.conn.execute('SELECT * FROM my_scanned').fetchall())
+        stats = self.scan_db.get_stats()
+        pool_count = stats['pool_blocks']
+        my_count = stats['my_blocks']
         if pool_count > 0 or my_count > 0:
             self.log("=" * 60, "info")
             self.log("📊 DATABASE LOADED", "success")
@@ -505,6 +1085,9 @@ class KeyHuntSmartGUI(Gtk.Window):
         # Start pool scraper thread (will add new blocks to existing database)
         self.start_pool_scraper()
         
+        # Coverage stats on their own 2 Hz cadence, not inside the draw handler
+        GLib.timeout_add(500, self.tick_coverage_stats)
+        
         # Handle window close
         self.connect("delete-event", self.on_window_close)
     
@@ -834,55 +1417,22 @@ class KeyHuntSmartGUI(Gtk.Window):
         factors_grid.attach(header, 0, row, 3, 1)
         row += 1
         
-        # Factor 1: Search Space Coverage
-        factors_grid.attach(Gtk.Label(label="1. Search Space Coverage:", xalign=0), 0, row, 1, 1)
-        self.prob_factor1_value = Gtk.Label(xalign=0)
-        self.prob_factor1_value.set_markup("<span foreground='#CCCCCC'>0.00%</span>")
-        factors_grid.attach(self.prob_factor1_value, 1, row, 1, 1)
-        self.prob_factor1_impact = Gtk.Label(xalign=0)
-        self.prob_factor1_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
-        factors_grid.attach(self.prob_factor1_impact, 2, row, 1, 1)
-        row += 1
-        
-        # Factor 2: Pattern Filtering
-        factors_grid.attach(Gtk.Label(label="2. Pattern Optimization:", xalign=0), 0, row, 1, 1)
-        self.prob_factor2_value = Gtk.Label(xalign=0)
-        self.prob_factor2_value.set_markup("<span foreground='#CCCCCC'>None active</span>")
-        factors_grid.attach(self.prob_factor2_value, 1, row, 1, 1)
-        self.prob_factor2_impact = Gtk.Label(xalign=0)
-        self.prob_factor2_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
-        factors_grid.attach(self.prob_factor2_impact, 2, row, 1, 1)
-        row += 1
-        
-        # Factor 3: Pool Coordination
-        factors_grid.attach(Gtk.Label(label="3. Pool Coordination:", xalign=0), 0, row, 1, 1)
-        self.prob_factor3_value = Gtk.Label(xalign=0)
-        self.prob_factor3_value.set_markup("<span foreground='#CCCCCC'>No data</span>")
-        factors_grid.attach(self.prob_factor3_value, 1, row, 1, 1)
-        self.prob_factor3_impact = Gtk.Label(xalign=0)
-        self.prob_factor3_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
-        factors_grid.attach(self.prob_factor3_impact, 2, row, 1, 1)
-        row += 1
-        
-        # Factor 4: Search Speed
-        factors_grid.attach(Gtk.Label(label="4. Search Speed:", xalign=0), 0, row, 1, 1)
-        self.prob_factor4_value = Gtk.Label(xalign=0)
-        self.prob_factor4_value.set_markup("<span foreground='#CCCCCC'>0 Mk/s</span>")
-        factors_grid.attach(self.prob_factor4_value, 1, row, 1, 1)
-        self.prob_factor4_impact = Gtk.Label(xalign=0)
-        self.prob_factor4_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
-        factors_grid.attach(self.prob_factor4_impact, 2, row, 1, 1)
-        row += 1
-        
-        # Factor 5: Time Investment
-        factors_grid.attach(Gtk.Label(label="5. Time Invested:", xalign=0), 0, row, 1, 1)
-        self.prob_factor5_value = Gtk.Label(xalign=0)
-        self.prob_factor5_value.set_markup("<span foreground='#CCCCCC'>00:00:00</span>")
-        factors_grid.attach(self.prob_factor5_value, 1, row, 1, 1)
-        self.prob_factor5_impact = Gtk.Label(xalign=0)
-        self.prob_factor5_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
-        factors_grid.attach(self.prob_factor5_impact, 2, row, 1, 1)
-        row += 1
+        # One row per factor: title, initial value, initial impact
+        self.prob_factor_values = []
+        self.prob_factor_impacts = []
+        for title, value in self.PROBABILITY_FACTORS:
+            factors_grid.attach(Gtk.Label(label=title, xalign=0), 0, row, 1, 1)
+            
+            value_label = Gtk.Label(xalign=0)
+            value_label.set_markup(f"<span foreground='#CCCCCC'>{value}</span>")
+            factors_grid.attach(value_label, 1, row, 1, 1)
+            self.prob_factor_values.append(value_label)
+            
+            impact_label = Gtk.Label(xalign=0)
+            impact_label.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
+            factors_grid.attach(impact_label, 2, row, 1, 1)
+            self.prob_factor_impacts.append(impact_label)
+            row += 1
         
         main_box.pack_start(factors_grid, False, False, 0)
         
@@ -908,6 +1458,10 @@ class KeyHuntSmartGUI(Gtk.Window):
         main_box.pack_start(rec_box, False, False, 0)
         
         frame.add(main_box)
+        
+        # Runtime ticks skip the dashboard while it's hidden - catch up when shown
+        self.probability_frame = frame
+        frame.connect("map", lambda w: self.update_probability_dashboard())
         return frame
     
     def draw_color_box(self, cr, r, g, b):
@@ -922,13 +1476,12 @@ class KeyHuntSmartGUI(Gtk.Window):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
         
-        # Background (dark grey)
+        # Background (dark grey) - paint() floods the clip, no path needed
         cr.set_source_rgb(0.2, 0.2, 0.2)
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
+        cr.paint()
         
-        # Calculate current probability
-        probability = self.calculate_discovery_probability()
+        # Calculate current probability (cached - it moves over seconds, not frames)
+        probability = self.get_discovery_probability()
         
         # Draw filled portion based on probability
         if probability > 0:
@@ -951,7 +1504,15 @@ class KeyHuntSmartGUI(Gtk.Window):
             cr.rectangle(0, 0, fill_width, height)
             cr.fill()
         
-        # Draw percentage markers
+        # Draw percentage markers (blitted from the cached surface)
+        cr.set_source_surface(self.get_bar_chrome("probability", cr, width, height,
+                                                  self.draw_probability_bar_chrome), 0, 0)
+        cr.paint()
+        
+        return False
+    
+    def draw_probability_bar_chrome(self, cr, width, height):
+        """Draw the static percentage markers of the probability bar"""
         cr.set_source_rgb(0.5, 0.5, 0.5)
         cr.set_line_width(1)
         cr.set_font_size(10)
@@ -959,16 +1520,33 @@ class KeyHuntSmartGUI(Gtk.Window):
         for i in [0, 25, 50, 75, 100]:
             x_pos = (i / 100.0) * width
             
-            # Vertical line
-            cr.move_to(x_pos, 0)
-            cr.line_to(x_pos, height)
-            cr.stroke()
-            
             # Label
             cr.move_to(x_pos + 2, height - 5)
             cr.show_text(f"{i}%")
         
-        return False
+        # Vertical lines, stroked in one pass
+        cr.new_path()
+        for i in [0, 25, 50, 75, 100]:
+            x_pos = (i / 100.0) * width
+            cr.move_to(x_pos, 0)
+            cr.line_to(x_pos, height)
+        cr.stroke()
+    
+    def get_bar_chrome(self, name, cr, width, height, draw_func):
+        """Get a bar's static ticks/labels/border as a pre-rendered surface
+        
+        Text is the slowest part of a redraw and the chrome only depends on
+        the widget size, so it is rasterised once per size (on a surface
+        matching the target, HiDPI scale included) and blitted with a
+        single paint.
+        """
+        cached = self.bar_chrome_cache.get(name)
+        if cached is None or cached[0] != (width, height):
+            surface = cr.get_target().create_similar(cairo.CONTENT_COLOR_ALPHA, width, height)
+            draw_func(cairo.Context(surface), width, height)
+            cached = ((width, height), surface)
+            self.bar_chrome_cache[name] = cached
+        return cached[1]
     
     def on_view_mode_changed(self, button, mode):
         """Handle view mode change"""
@@ -980,23 +1558,22 @@ class KeyHuntSmartGUI(Gtk.Window):
     
     def refresh_block_cache(self):
         """Refresh cached blocks from database - only call when blocks change!"""
-        cursor = self.scan_db.conn.cursor()
-        cursor.execute('SELECT block_start, block_end FROM pool_scanned ORDER BY block_start')
-        self.cached_pool_blocks = cursor.fetchall()
-        cursor.execute('SELECT block_start, block_end FROM my_scanned ORDER BY block_start')
-        self.cached_my_blocks = cursor.fetchall()
+        # Only the merged intervals are kept - drawing and stats never need
+        # the raw per-block rows, and contiguous scans collapse to a handful
+        self.pool_intervals = BlockIntervals(self.scan_db.get_pool_blocks())
+        self.my_intervals = BlockIntervals(self.scan_db.get_my_blocks())
+        self.bar_runs_cache = {}
         self.cache_dirty = False
         
-        # DEBUG: Print what we loaded
-        print(f"\n{'='*60}")
-        print(f"CACHE REFRESH")
-        print(f"{'='*60}")
-        print(f"Loaded {len(self.cached_pool_blocks)} pool blocks from database")
-        print(f"Loaded {len(self.cached_my_blocks)} my blocks from database")
-        if len(self.cached_pool_blocks) > 0:
-            print(f"First pool block: {self.cached_pool_blocks[0][0]} to {self.cached_pool_blocks[0][1]}")
-            print(f"Last pool block:  {self.cached_pool_blocks[-1][0]} to {self.cached_pool_blocks[-1][1]}")
-        print(f"{'='*60}\n")
+        # DEBUG: What we loaded (off by default)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CACHE REFRESH: %d merged pool intervals, %d merged my intervals",
+                         len(self.pool_intervals), len(self.my_intervals))
+            if len(self.pool_intervals) > 0:
+                logger.debug("   First pool interval: 0x%X to 0x%X",
+                             self.pool_intervals.starts[0], self.pool_intervals.ends[0])
+                logger.debug("   Last pool interval:  0x%X to 0x%X",
+                             self.pool_intervals.starts[-1], self.pool_intervals.ends[-1])
     
     def on_draw_progress_bar(self, widget, cr):
         """Draw the visual progress bar"""
@@ -1006,122 +1583,54 @@ class KeyHuntSmartGUI(Gtk.Window):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
         
-        # Background (dark grey - unscanned)
+        # Background (dark grey - unscanned) - paint() floods the clip, no path needed
         cr.set_source_rgb(0.15, 0.15, 0.15)
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
+        cr.paint()
         
         # Refresh cache if needed (only when blocks change, not every frame!)
         if self.cache_dirty:
             self.refresh_block_cache()
         
-        # Use CACHED blocks (no DB query!)
-        pool_blocks = self.cached_pool_blocks
-        my_blocks = self.cached_my_blocks
-        
-        # Determine display range based on view mode
-        puzzle_num = self.get_current_puzzle_number()
-        if puzzle_num in self.PUZZLE_PRESETS:
-            preset = self.PUZZLE_PRESETS[puzzle_num]
-            full_range_start = int(preset['range_start'], 16)
-            full_range_end = int(preset['range_end'], 16)
-        else:
-            full_range_start = self.range_start_value
-            full_range_end = self.range_end_value
-        
-        # Adjust range based on view mode
-        if self.view_mode == "full":
-            # Show entire keyspace
-            display_start = full_range_start
-            display_end = full_range_end
-            frame_label = f"Keyspace Coverage: Full (0x{full_range_start:X} to 0x{full_range_end:X})"
-        elif self.view_mode == "myrange":
-            # Show only user's configured range
-            display_start = self.range_start_value
-            display_end = self.range_end_value
-            frame_label = f"Keyspace Coverage: My Range (0x{display_start:X} to 0x{display_end:X})"
-        elif self.view_mode in ["4", "5", "6", "7"]:
-            # Show specific hex prefix range (e.g., all of 0x4... or 0x5...)
-            prefix_int = int(self.view_mode, 16)
-            # Calculate the range for this prefix in 71-bit space
-            # For 71 bits, each prefix covers 1/4 of the space
-            range_size = full_range_end - full_range_start + 1
-            prefix_size = range_size // 4
-            display_start = full_range_start + (prefix_int - 4) * prefix_size
-            display_end = display_start + prefix_size - 1
-            frame_label = f"Keyspace Coverage: 0x{prefix_int}... Only"
-        else:
-            display_start = full_range_start
-            display_end = full_range_end
-            frame_label = "Keyspace Coverage"
+        # Determine display range based on view mode (cached until it changes)
+        full_range_start, full_range_end, display_start, display_end = self.get_display_range()
         
         total_range = display_end - display_start + 1
         
-        # DEBUG: Print what we're about to draw
-        print(f"\n{'='*60}")
-        print(f"VISUALIZATION DEBUG")
-        print(f"{'='*60}")
-        print(f"Display range: 0x{display_start:X} to 0x{display_end:X}")
-        print(f"Total range size: {total_range:,} keys")
-        print(f"Pool blocks in cache: {len(pool_blocks)}")
-        print(f"My blocks in cache: {len(my_blocks)}")
-        if len(pool_blocks) > 0:
-            first_start = int(pool_blocks[0][0], 16)
-            first_end = int(pool_blocks[0][1], 16)
-            print(f"First pool block: 0x{first_start:X} to 0x{first_end:X}")
-        print(f"{'='*60}\n")
+        # DEBUG: What we're about to draw (off by default - this runs every frame)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("VISUALIZATION: 0x%X to 0x%X (%s keys), %d pool / %d my intervals",
+                         display_start, display_end, f"{total_range:,}",
+                         len(self.pool_intervals), len(self.my_intervals))
+        
+        # Pixel runs only change with the block cache, widget width or view
+        runs_key = (width, display_start, display_end)
+        runs = self.bar_runs_cache.get(runs_key)
+        if runs is None:
+            runs = (self.pool_intervals.pixel_runs(display_start, display_end, width),
+                    self.my_intervals.pixel_runs(display_start, display_end, width))
+            self.bar_runs_cache[runs_key] = runs
+        pool_runs, my_runs = runs
+        
+        # Runs sit on whole pixels, so skip edge antialiasing for the solid fills
+        cr.save()
+        cr.set_antialias(cairo.ANTIALIAS_NONE)
         
         # Draw pool scanned blocks (blue) at their ACTUAL positions
         cr.set_source_rgb(0.2, 0.6, 1.0)
-        for block_start_hex, block_end_hex in pool_blocks:
-            # Convert hex strings back to integers
-            block_start = int(block_start_hex, 16)
-            block_end = int(block_end_hex, 16)
-            
-            # Draw blocks that OVERLAP the display range (not just fully contained)
-            if block_end >= display_start and block_start <= display_end:
-                # Clip to display range
-                visible_start = max(block_start, display_start)
-                visible_end = min(block_end, display_end)
-                
-                # Calculate position relative to DISPLAY range
-                start_percent = (visible_start - display_start) / total_range
-                end_percent = (visible_end - display_start + 1) / total_range
-                
-                # Convert to pixel positions
-                x_start = start_percent * width
-                x_end = end_percent * width
-                x_width = max(1, x_end - x_start)  # At least 1 pixel visible
-                
-                cr.rectangle(x_start, 0, x_width, height)
-                cr.fill()
+        for x_start, x_width in pool_runs:
+            cr.rectangle(x_start, 0, x_width, height)
+        cr.fill()
         
         # Draw my scanned blocks (green) at their ACTUAL positions
         cr.set_source_rgb(0.3, 0.8, 0.3)
-        for block_start_hex, block_end_hex in my_blocks:
-            # Convert hex strings back to integers
-            block_start = int(block_start_hex, 16)
-            block_end = int(block_end_hex, 16)
-            
-            # Draw blocks that OVERLAP the display range
-            if block_end >= display_start and block_start <= display_end:
-                # Clip to display range
-                visible_start = max(block_start, display_start)
-                visible_end = min(block_end, display_end)
-                
-                # Calculate position relative to DISPLAY range
-                start_percent = (visible_start - display_start) / total_range
-                end_percent = (visible_end - display_start + 1) / total_range
-                
-                # Convert to pixel positions
-                x_start = start_percent * width
-                x_end = end_percent * width
-                x_width = max(1, x_end - x_start)
-                
-                cr.rectangle(x_start, 0, x_width, height)
-                cr.fill()
+        for x_start, x_width in my_runs:
+            cr.rectangle(x_start, 0, x_width, height)
+        cr.fill()
+        
+        cr.restore()
         
         # Draw currently scanning block (yellow/orange) at its ACTUAL position
+        self.current_block_area = None
         if self.current_block and self.is_running:
             block_start, block_end = self.current_block
             
@@ -1161,6 +1670,12 @@ class KeyHuntSmartGUI(Gtk.Window):
                 text_y = height / 2 + text_extents.height / 2
                 cr.move_to(text_x, text_y)
                 cr.show_text(percent_text)
+                
+                # Remember what this block (and its label) painted, so progress
+                # ticks can invalidate just that strip
+                area_start = int(min(x_start, text_x)) - 1
+                area_end = int(max(x_start + x_width, text_x + text_extents.x_advance)) + 2
+                self.current_block_area = (self.current_block, width, area_start, area_end - area_start)
         
         # Draw user's search range indicator (semi-transparent overlay)
         if full_range_start != self.range_start_value or full_range_end != self.range_end_value:
@@ -1181,12 +1696,19 @@ class KeyHuntSmartGUI(Gtk.Window):
             cr.set_line_width(2)
             cr.move_to(x_start, 0)
             cr.line_to(x_start, height)
-            cr.stroke()
             cr.move_to(x_end, 0)
             cr.line_to(x_end, height)
             cr.stroke()
         
-        # Draw percentage markers (every 10%)
+        # Draw percentage markers and border (blitted from the cached surface)
+        cr.set_source_surface(self.get_bar_chrome("progress", cr, width, height,
+                                                  self.draw_progress_bar_chrome), 0, 0)
+        cr.paint()
+        
+        return False
+    
+    def draw_progress_bar_chrome(self, cr, width, height):
+        """Draw the static percentage markers and border of the progress bar"""
         cr.set_source_rgb(0.5, 0.5, 0.5)
         cr.set_line_width(1)
         cr.set_font_size(10)
@@ -1194,11 +1716,6 @@ class KeyHuntSmartGUI(Gtk.Window):
         for i in range(0, 11):  # 0%, 10%, 20%, ... 100%
             x_pos = (i / 10.0) * width
             
-            # Vertical tick mark
-            cr.move_to(x_pos, height - 5)
-            cr.line_to(x_pos, height)
-            cr.stroke()
-            
             # Percentage label
             if i % 2 == 0:  # Only label every 20% to avoid crowding
                 label = f"{i*10}%"
@@ -1209,24 +1726,32 @@ class KeyHuntSmartGUI(Gtk.Window):
                 cr.move_to(label_x, label_y)
                 cr.show_text(label)
         
-        # Border
-        cr.set_source_rgb(0.5, 0.5, 0.5)
-        cr.set_line_width(1)
+        # Tick marks and border share the same pen, so stroke them in one pass
+        cr.new_path()
+        for i in range(0, 11):
+            x_pos = (i / 10.0) * width
+            cr.move_to(x_pos, height - 5)
+            cr.line_to(x_pos, height)
         cr.rectangle(0, 0, width, height)
         cr.stroke()
-        
-        # Update coverage stats
-        self.update_coverage_stats()
-        
-        return False
     
     def on_refresh_visualization(self, button):
         """Manually refresh the keyspace visualization"""
+        # Bursts of clicks collapse into one refresh on the next idle cycle
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            GLib.idle_add(self.do_refresh_visualization)
+    
+    def do_refresh_visualization(self):
+        """Idle handler doing the actual visualization refresh"""
+        self.refresh_pending = False
         self.cache_dirty = True  # Force cache refresh
+        self.probability_cache = None
         if self.progress_drawing:
             self.progress_drawing.queue_draw()
         self.update_coverage_stats()
         self.log("🔄 Visualization refreshed", "info")
+        return False
     
     def clear_pool_data(self):
         """Clear all pool scanned data - use after fixing range issues"""
@@ -1234,39 +1759,50 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.log("⚠️ Cannot clear pool data while running!", "warning")
             return
         
-        cursor = self.scan_db.conn.cursor()
-        cursor.execute('DELETE FROM pool_scanned')
-        self.scan_db.conn.commit()
+        self.scan_db.clear_pool_blocks()
         self.cache_dirty = True
         self.log("🗑️ Cleared all pool data - will re-scrape on next start", "success")
         
-        # Force immediate re-scrape
-        self.scrape_pool()
+        # Force immediate re-scrape on the scraper thread
+        self._scraper_wakeup.set()
     
-    def update_coverage_stats(self):
-        """Update coverage statistics text based on current view mode"""
-        if not self.block_mgr:
-            return
+    def tick_coverage_stats(self):
+        """Periodic coverage stats refresh (cheap when nothing changed)"""
+        self.update_coverage_stats()
+        return True  # Keep the timer running
+    
+    def get_display_range(self):
+        """Get (full_start, full_end, display_start, display_end) for the current view
+        
+        Recomputed only when the puzzle, view mode or configured range changes;
+        otherwise the draw and stats paths reuse the last result.
+        """
+        key = (self.puzzle_combo.get_active_text(), self.view_mode,
+               self.range_start_value, self.range_end_value)
+        if self.display_range is not None and self.display_range[0] == key:
+            return self.display_range[1]
         
-        # Determine display range based on view mode
         puzzle_num = self.get_current_puzzle_number()
         if puzzle_num in self.PUZZLE_PRESETS:
-            preset = self.PUZZLE_PRESETS[puzzle_num]
-            full_range_start = int(preset['range_start'], 16)
-            full_range_end = int(preset['range_end'], 16)
+            full_range_start, full_range_end = self.get_preset_range(puzzle_num)
         else:
             full_range_start = self.range_start_value
             full_range_end = self.range_end_value
         
         # Adjust range based on view mode
         if self.view_mode == "full":
+            # Show entire keyspace
             display_start = full_range_start
             display_end = full_range_end
         elif self.view_mode == "myrange":
+            # Show only user's configured range
             display_start = self.range_start_value
             display_end = self.range_end_value
         elif self.view_mode in ["4", "5", "6", "7"]:
+            # Show specific hex prefix range (e.g., all of 0x4... or 0x5...)
             prefix_int = int(self.view_mode, 16)
+            # Calculate the range for this prefix in 71-bit space
+            # For 71 bits, each prefix covers 1/4 of the space
             range_size = full_range_end - full_range_start + 1
             prefix_size = range_size // 4
             display_start = full_range_start + (prefix_int - 4) * prefix_size
@@ -1275,41 +1811,27 @@ class KeyHuntSmartGUI(Gtk.Window):
             display_start = full_range_start
             display_end = full_range_end
         
+        result = (full_range_start, full_range_end, display_start, display_end)
+        self.display_range = (key, result)
+        return result
+    
+    def update_coverage_stats(self):
+        """Update coverage statistics text based on current view mode"""
+        if not self.block_mgr:
+            return
+        
+        # Determine display range based on view mode
+        full_range_start, full_range_end, display_start, display_end = self.get_display_range()
+        
         full_keyspace = display_end - display_start + 1
         
-        # Count blocks within the DISPLAY range
-        cursor = self.scan_db.conn.cursor()
-        cursor.execute('SELECT block_start, block_end FROM pool_scanned')
-        all_pool_blocks = cursor.fetchall()
-        
-        # Count OVERLAPPING pool blocks and calculate their total coverage
-        pool_coverage_keys = 0
-        for block_start_hex, block_end_hex in all_pool_blocks:
-            block_start = int(block_start_hex, 16)
-            block_end = int(block_end_hex, 16)
-            # Check if block overlaps the display range
-            if block_end >= display_start and block_start <= display_end:
-                # Calculate the overlapping portion
-                overlap_start = max(block_start, display_start)
-                overlap_end = min(block_end, display_end)
-                overlap_keys = overlap_end - overlap_start + 1
-                pool_coverage_keys += overlap_keys
-        
-        cursor.execute('SELECT block_start, block_end FROM my_scanned')
-        all_my_blocks = cursor.fetchall()
-        
-        # Count OVERLAPPING my blocks and calculate their total coverage
-        my_coverage_keys = 0
-        for block_start_hex, block_end_hex in all_my_blocks:
-            block_start = int(block_start_hex, 16)
-            block_end = int(block_end_hex, 16)
-            # Check if block overlaps the display range
-            if block_end >= display_start and block_start <= display_end:
-                # Calculate the overlapping portion
-                overlap_start = max(block_start, display_start)
-                overlap_end = min(block_end, display_end)
-                overlap_keys = overlap_end - overlap_start + 1
-                my_coverage_keys += overlap_keys
+        # Use CACHED intervals (no DB query, no per-block loop)
+        if self.cache_dirty:
+            self.refresh_block_cache()
+        
+        # Keys covered within the DISPLAY range (overlapping blocks counted once)
+        pool_coverage_keys = self.pool_intervals.covered_keys(display_start, display_end)
+        my_coverage_keys = self.my_intervals.covered_keys(display_start, display_end)
         
         # Calculate percentages based on ACTUAL key coverage
         pool_percent = (pool_coverage_keys / full_keyspace) * 100 if full_keyspace > 0 else 0
@@ -1326,7 +1848,11 @@ class KeyHuntSmartGUI(Gtk.Window):
             f"</span>"
         )
         
-        self.coverage_stats_label.set_markup(coverage_text)
+        # Called from every progress-bar draw - skip the markup reparse and
+        # relayout when the numbers haven't moved
+        if coverage_text != self.coverage_stats_text:
+            self.coverage_stats_text = coverage_text
+            self.coverage_stats_label.set_markup(coverage_text)
     
     def create_config_page(self):
         """Create configuration page"""
@@ -1575,7 +2101,16 @@ class KeyHuntSmartGUI(Gtk.Window):
         grid.attach(Gtk.Label(label="GPU ID:", xalign=0), 0, row, 1, 1)
         self.gpu_id = Gtk.Entry()
         self.gpu_id.set_text("0")
-        grid.attach(self.gpu_id, 1, row, 2, 1)
+        self.gpu_id.set_tooltip_text("One device, or several comma-separated (e.g. 0,1)")
+        grid.attach(self.gpu_id, 1, row, 1, 1)
+        
+        self.autotune_btn = Gtk.Button(label="⚡ Autotune Grid")
+        self.autotune_btn.set_tooltip_text(
+            f"Probe {len(GPUX_CANDIDATES)} --gpux grids for {GPUX_PROBE_SECONDS}s each "
+            f"and keep the fastest for this GPU"
+        )
+        self.autotune_btn.connect("clicked", self.on_autotune_gpux)
+        grid.attach(self.autotune_btn, 2, row, 1, 1)
         row += 1
         
         # CONTROL BUTTONS (duplicated here for easy access)
@@ -1627,20 +2162,13 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.console_view.set_editable(False)
         self.console_view.set_wrap_mode(Gtk.WrapMode.WORD)
         self.console_view.set_monospace(True)
-        
-        # Use CSS for styling instead of deprecated methods
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            textview {
-                background-color: #1a1a1a;
-                color: #dddddd;
-            }
-        """)
-        context = self.console_view.get_style_context()
-        context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        self.console_view.set_name("console_view")  # Styled by apply_css
         
         self.console_buffer = self.console_view.get_buffer()
         
+        # Right gravity keeps this mark after every insert - auto-scroll target
+        self.console_end_mark = self.console_buffer.create_mark("end", self.console_buffer.get_end_iter(), False)
+        
         # Tags for colored output (high contrast colors for dark background)
         self.console_buffer.create_tag("info", foreground="#DDDDDD")
         self.console_buffer.create_tag("success", foreground="#00FFFF", weight=Pango.Weight.BOLD)  # Bright cyan instead of green
@@ -1694,7 +2222,7 @@ class KeyHuntSmartGUI(Gtk.Window):
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         
         # Create ListStore: Index, Start, End, Size, Status
-        self.block_store = Gtk.ListStore(int, str, str, str, str, str, str)  # index, start, end, size, status, start_int, end_int
+        self.block_store = Gtk.ListStore(int, str, str, str, str)  # index, start, end, size, status
         
         self.block_tree_view = Gtk.TreeView(model=self.block_store)
         self.block_tree_view.set_name("block_tree_view")
@@ -1718,17 +2246,6 @@ class KeyHuntSmartGUI(Gtk.Window):
         # Add right-click context menu
         self.block_tree_view.connect("button-press-event", self.on_block_right_click)
         
-        # Style
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            #block_tree_view {
-                background-color: #1a1a1a;
-                color: #e5e5e5;
-            }
-        """)
-        context = self.block_tree_view.get_style_context()
-        context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-        
         scrolled.add(self.block_tree_view)
         
         box.pack_start(scrolled, True, True, 0)
@@ -1760,25 +2277,34 @@ class KeyHuntSmartGUI(Gtk.Window):
         info_label.set_xalign(0)
         box.pack_start(info_label, False, False, 0)
         
+        # Database status summary
+        self.exclusions_summary_label = Gtk.Label(xalign=0)
+        box.pack_start(self.exclusions_summary_label, False, False, 0)
+        
         # Exclusions list (scrollable)
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         
-        self.exclusions_view = Gtk.TextView()
-        self.exclusions_view.set_editable(False)
-        self.exclusions_view.set_monospace(True)
-        self.exclusions_view.set_name("exclusions_view")
+        # Create ListStore: Source, Start, End, Keys, then hidden Start/End sort keys
+        # Keys are numeric so the column sorts by value - formatted at render time.
+        # Bounds are too wide for any GObject integer type, so Start/End sort on
+        # fixed-width hex instead of the shown "0x..." text (17 vs 18 digits)
+        self.exclusions_store = Gtk.ListStore(str, str, str, GObject.TYPE_UINT64, str, str)
+        sort_columns = {1: 4, 2: 5}  # Start -> padded start, End -> padded end
         
-        # Use CSS for styling
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(b"""
-            #exclusions_view {
-                background-color: #1a1a1a;
-                color: #e5e5e5;
-            }
-        """)
-        context = self.exclusions_view.get_style_context()
-        context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        self.exclusions_view = Gtk.TreeView(model=self.exclusions_store)
+        self.exclusions_view.set_name("exclusions_view")  # Styled by apply_css
+        
+        for col_id, title in enumerate(("Scanned By", "Start", "End", "Keys Checked")):
+            renderer = Gtk.CellRendererText()
+            if col_id == 3:
+                column = Gtk.TreeViewColumn(title, renderer)
+                column.set_cell_data_func(renderer, self.render_keys_checked)
+            else:
+                column = Gtk.TreeViewColumn(title, renderer, text=col_id)
+            column.set_resizable(True)
+            column.set_sort_column_id(sort_columns.get(col_id, col_id))
+            self.exclusions_view.append_column(column)
         
         scrolled.add(self.exclusions_view)
         box.pack_start(scrolled, True, True, 0)
@@ -1888,7 +2414,8 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         # Status
         self.manual_status_label = Gtk.Label()
-        self.manual_status_label.set_markup("<span foreground='#CCCCCC'>Ready to import ranges</span>")
+        self.manual_status_kind = None
+        self.set_manual_status("Ready to import ranges", "neutral")
         main_box.pack_start(self.manual_status_label, False, False, 0)
         
         return main_box
@@ -1923,13 +2450,25 @@ class KeyHuntSmartGUI(Gtk.Window):
         return box
     
     def apply_css(self):
-        """Apply CSS styling"""
+        """Apply CSS styling - one stylesheet, parsed once, for every widget"""
         css_provider = Gtk.CssProvider()
         css = b"""
         window {
             background-color: #1e1e1e;
             color: #ffffff;
         }
+        #console_view {
+            background-color: #1a1a1a;
+            color: #dddddd;
+        }
+        #block_tree_view, #exclusions_view {
+            background-color: #1a1a1a;
+            color: #e5e5e5;
+        }
+        .status-ok { color: #4CAF50; }
+        .status-error { color: #F44336; }
+        .status-warning { color: #FF9800; }
+        .status-neutral { color: #CCCCCC; }
         """
         css_provider.load_from_data(css)
         Gtk.StyleContext.add_provider_for_screen(
@@ -1939,75 +2478,165 @@ class KeyHuntSmartGUI(Gtk.Window):
         )
     
     def log(self, message, tag="info"):
-        """Log message to console - thread-safe wrapper"""
-        # If not on main thread, schedule on main thread
-        if threading.current_thread() != threading.main_thread():
-            GLib.idle_add(self._log_impl, message, tag)
-        else:
-            self._log_impl(message, tag)
-    
-    def _log_impl(self, message, tag="info"):
-        """Internal log implementation - must run on main thread"""
+        """Log message to console - thread-safe, batched per idle cycle"""
+        # deque.append is atomic, so any thread can queue a line
         timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_queue.append((timestamp, message, tag))
         
-        # Get end iterator and insert timestamp
-        end_iter = self.console_buffer.get_end_iter()
-        self.console_buffer.insert(end_iter, f"[{timestamp}] ")
+        if not self.log_flush_scheduled:
+            self.log_flush_scheduled = True
+            GLib.idle_add(self._log_impl)
+    
+    def _log_impl(self):
+        """Flush queued log lines - must run on main thread"""
+        self.log_flush_scheduled = False
+        if not self.log_queue:
+            return False
         
-        # Get fresh end iterator for message (previous one is invalid after insert)
-        end_iter = self.console_buffer.get_end_iter()
-        self.console_buffer.insert_with_tags_by_name(end_iter, f"{message}\n", tag)
+        # Build the whole burst as one string, remembering each message span
+        start_offset = self.console_buffer.get_char_count()
+        pieces = []
+        tag_spans = []
+        offset = start_offset
+        while self.log_queue:
+            timestamp, message, tag = self.log_queue.popleft()
+            prefix = f"[{timestamp}] "
+            line = f"{message}\n"
+            offset += len(prefix)
+            tag_spans.append((tag, offset, offset + len(line)))
+            offset += len(line)
+            pieces.append(prefix)
+            pieces.append(line)
+        
+        # One insert for the burst, then tag the message parts
+        self.console_buffer.insert(self.console_buffer.get_end_iter(), ''.join(pieces))
+        for tag, span_start, span_end in tag_spans:
+            self.console_buffer.apply_tag_by_name(tag,
+                                                  self.console_buffer.get_iter_at_offset(span_start),
+                                                  self.console_buffer.get_iter_at_offset(span_end))
         
         # Auto-scroll to end
-        end_mark = self.console_buffer.create_mark(None, self.console_buffer.get_end_iter(), False)
-        self.console_view.scroll_to_mark(end_mark, 0.0, True, 0.0, 1.0)
-        self.console_buffer.delete_mark(end_mark)
+        self.console_view.scroll_mark_onscreen(self.console_end_mark)
+        
+        return False  # Don't repeat - the next log() schedules a new flush
+    
+    def queue_search_ui(self, field, value):
+        """Record the latest value for a search widget - thread-safe, coalesced"""
+        # Only the newest value per field survives until the next flush
+        self.search_ui_pending[field] = value
+        
+        if not self.search_ui_scheduled:
+            self.search_ui_scheduled = True
+            GLib.timeout_add(100, self._apply_search_ui)
+    
+    def _apply_search_ui(self):
+        """Apply queued search widget values - must run on main thread"""
+        self.search_ui_scheduled = False
+        pending = self.search_ui_pending
+        
+        # pop() so a value queued meanwhile is left for the flush it schedules
+        speed = pending.pop('speed', None)
+        if speed is not None:
+            self.current_speed = speed  # Mk/s as a float - ETA and dashboard read it
+            self.speed_value.set_text(f"{speed:.2f} Mk/s")
+        
+        # Key counts arrive raw - everything derived from them is worked out
+        # here, once per flush, instead of for every KeyHunt status line
+        counts = pending.pop('keys', None)
+        if counts is not None:
+            total_keys, keys_in_block = counts
+            self.keys_value.set_text(f"{total_keys:,}")
+            
+            # Update current block progress bar
+            progress = min(1.0, total_keys / keys_in_block)
+            self.current_block_progressbar.set_fraction(progress)
+            self.current_block_progressbar.set_text(f"{progress * 100:.2f}%")
+            
+            # Update stats
+            remaining = keys_in_block - total_keys
+            eta_seconds = remaining / (self.current_speed * 1_000_000) if self.current_speed > 0 else 0
+            eta_minutes = eta_seconds / 60
+            
+            stats_text = (
+                f"<span size='small'>"
+                f"Checked: <b>{total_keys:,}</b> / {keys_in_block:,} keys | "
+                f"Remaining: <b>{remaining:,}</b> | "
+                f"ETA: <b>{eta_minutes:.1f} min</b>"
+                f"</span>"
+            )
+            self.current_block_stats.set_markup(stats_text)
         
-        return False  # Don't repeat if called via GLib.idle_add
+        return False  # Don't repeat - the next queue_search_ui() schedules a new flush
     
     def start_pool_scraper(self):
         """Start background pool scraper thread"""
-        def scraper_loop():
-            while True:
-                if not self.is_running or datetime.now().timestamp() - (self.last_pool_scrape or 0) > self.scrape_interval:
-                    GLib.idle_add(self.scrape_pool)
-                threading.Event().wait(60)  # Check every minute
-        
-        thread = threading.Thread(target=scraper_loop, daemon=True)
-        thread.start()
+        self._scraper_stopped = False
+        self._scraper_wakeup.clear()
+        self._scraper_thread = threading.Thread(target=self._pool_scraper_loop, daemon=True)
+        self._scraper_thread.start()
+    
+    def _pool_scraper_loop(self):
+        """Scrape when due or when woken - one persistent thread, one persistent event"""
+        manual = False
+        while not self._scraper_stopped:
+            if (manual or not self.is_running or self.last_pool_scrape is None
+                    or time.monotonic() - self.last_pool_scrape > self.scrape_interval):
+                self.scrape_pool()
+            
+            # Sleeps the full minute unless a manual scrape or shutdown sets the event
+            manual = self._scraper_wakeup.wait(60)  # Check every minute
+            self._scraper_wakeup.clear()
+    
+    def stop_pool_scraper(self):
+        """Stop the pool scraper thread and wake it so it exits promptly"""
+        self._scraper_stopped = True
+        self._scraper_wakeup.set()
     
     def scrape_pool(self):
-        """Scrape pool for scanned ranges"""
+        """Scrape pool for scanned ranges (scraper thread - no GTK calls)"""
+        # The puzzle may switch while the fetch is in flight - the page, its
+        # validators and the stored results all belong to this snapshot
+        puzzle = self.current_puzzle
+        
         self.log("=" * 60, "info")
         self.log("🌐 STARTING POOL SCRAPE FROM LIVE WEBSITE", "info")
         self.log("=" * 60, "info")
-        self.log(f"🔗 URL: https://btcpuzzle.info/puzzle/{self.get_current_puzzle_number()}", "info")
+        self.log(f"🔗 URL: https://btcpuzzle.info/puzzle/{puzzle}", "info")
         self.log("📡 Fetching data... (this is NOT hardcoded!)", "info")
         
         try:
             # The print statements from pool_scraper will show in terminal
-            scanned_blocks = self.pool_scraper.scrape_scanned_ranges()
+            scanned_blocks = self.pool_scraper.scrape_scanned_ranges(puzzle)
             
             if scanned_blocks:
                 self.log(f"📦 Received {len(scanned_blocks)} blocks from website", "success")
                 
+                if self.current_puzzle != puzzle:
+                    self.log(f"⚠ Switched away from Puzzle #{puzzle} during scrape - results dropped", "warning")
+                    return
+                
                 # Check for collision with current block BEFORE adding to database
                 collision_detected = False
                 if self.current_block and self.is_running:
-                    current_start, current_end = self.current_block
-                    for block_start, block_end in scanned_blocks:
-                        # Check if pool just scanned our current block
-                        if block_start == current_start and block_end == current_end:
-                            collision_detected = True
-                            self.log("⚠️ COLLISION DETECTED! Pool completed our current block!", "warning")
-                            break
+                    # Scraper output is sorted and de-duplicated, so an exact
+                    # (start, end) match is a bisect away - no Python loop
+                    current = tuple(self.current_block)
+                    i = bisect.bisect_left(scanned_blocks, current)
+                    if i < len(scanned_blocks) and scanned_blocks[i] == current:
+                        # Pool just scanned our current block
+                        collision_detected = True
+                        self.log("⚠️ COLLISION DETECTED! Pool completed our current block!", "warning")
                 
                 # Add blocks to database and get counts
-                added_count, duplicate_count = self.scan_db.add_pool_blocks(scanned_blocks)
+                counts = self.scan_db.add_pool_blocks(scanned_blocks, puzzle)
+                if counts is None:
+                    self.log(f"⚠ Switched away from Puzzle #{puzzle} during scrape - results dropped", "warning")
+                    return
+                added_count, duplicate_count = counts
                 self.cache_dirty = True  # Refresh cache on next redraw
                 
                 # Get total pool blocks in database
-                total_pool_blocks = len(self.scan_db.conn.execute('SELECT * FROM pool_scanned').fetchall())
+                total_pool_blocks = self.scan_db.count_pool_blocks()
                 
                 # Show stats about what was added
                 self.log(f"📊 Pool Scrape Results:", "info")
@@ -2018,16 +2647,10 @@ class KeyHuntSmartGUI(Gtk.Window):
                 
                 # DIAGNOSTIC: Show range of pool blocks
                 if scanned_blocks:
-                    starts = []
-                    ends = []
-                    for b in scanned_blocks:
-                        # Handle both string and int formats
-                        start = int(b[0], 16) if isinstance(b[0], str) else b[0]
-                        end = int(b[1], 16) if isinstance(b[1], str) else b[1]
-                        starts.append(start)
-                        ends.append(end)
-                    min_start = hex(min(starts))
-                    max_end = hex(max(ends))
+                    # Collapsed blocks are sorted by start and none sits inside
+                    # another, so ends ascend too: the extremes are the endpoints
+                    min_start = f"0x{scanned_blocks[0][0]:X}"
+                    max_end = f"0x{scanned_blocks[-1][1]:X}"
                     
                     self.log(f"📊 Range Summary:", "info")
                     self.log(f"   • Earliest block: {min_start}", "info")
@@ -2035,8 +2658,9 @@ class KeyHuntSmartGUI(Gtk.Window):
                 
                 self.log(f"✅ Pool scrape complete!", "success")
                 self.log("💡 Check terminal/console for detailed scrape log!", "info")
-                self.last_pool_scrape = datetime.now().timestamp()
-                self.update_smart_status()
+                self.last_pool_scrape = time.monotonic()
+                self.last_pool_scrape_wall = datetime.now()
+                GLib.idle_add(self.update_smart_status)
                 
                 # Update probability dashboard
                 GLib.idle_add(self.update_probability_dashboard)
@@ -2066,23 +2690,14 @@ class KeyHuntSmartGUI(Gtk.Window):
         # Mark current block as scanned by pool (already in DB)
         # Don't add to my_scanned since we didn't complete it
         
-        # Find next unscanned block
+        # Find next unscanned block - its search starts once it is found
         self.current_block_index += 1
         self.keys_checked = 0
         self.find_next_block()
-        
-        if self.current_block:
-            self.log(f"✅ Switched to fresh block #{self.current_block_index}", "success")
-            # Continue searching
-            thread = threading.Thread(target=self.run_block_search, daemon=True)
-            thread.start()
-        else:
-            self.log("✅ No more fresh blocks available!", "success")
-            self.on_stop(None)
     
     def on_manual_scrape(self, button):
-        """Manual pool scrape trigger"""
-        threading.Thread(target=self.scrape_pool, daemon=True).start()
+        """Manual pool scrape trigger - wakes the scraper thread"""
+        self._scraper_wakeup.set()
     
     def update_smart_status(self):
         """Update smart coordinator status display"""
@@ -2091,8 +2706,8 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.pool_exclusions_value.set_text(f"{stats['pool_blocks']} blocks")
         self.my_blocks_value.set_text(f"{stats['my_blocks']} blocks")
         
-        if self.last_pool_scrape:
-            last_scrape = datetime.fromtimestamp(self.last_pool_scrape)
+        if self.last_pool_scrape_wall:
+            last_scrape = self.last_pool_scrape_wall
             self.last_scrape_value.set_text(last_scrape.strftime("%H:%M:%S"))
             
             next_scrape = last_scrape + timedelta(seconds=self.scrape_interval)
@@ -2144,103 +2759,140 @@ class KeyHuntSmartGUI(Gtk.Window):
         else:
             self.log("⚠ Failed to save state", "warning")
     
+    def update_block_counts(self):
+        """Update the total / remaining block counters above the block list"""
+        total_blocks = self.block_mgr.total_blocks
+        my_completed = self.scan_db.count_my_blocks()
+        pool_scanned = self.scan_db.count_pool_blocks()
+        remaining = total_blocks - my_completed - pool_scanned
+        
+        self.total_blocks_label.set_text(f"{total_blocks:,}")
+        self.remaining_blocks_label.set_text(f"{remaining:,}")
+    
+    def get_block_status(self, block_index, block):
+        """Status column text for a block in the block list"""
+        scanned, by_whom = self.scan_db.is_block_scanned(block[0], block[1])
+        if scanned:
+            return f"✅ Done ({by_whom})"
+        elif block_index == self.current_block_index:
+            return "⚙️ Current"
+        else:
+            return "⏳ Pending"
+    
+    def refresh_block_row(self, block_index):
+        """Update one block's status in place after it changed (no full repopulate)"""
+        if not self.block_mgr:
+            return
+        
+        self.update_block_counts()
+        
+        # Setting a column through the row emits row-changed for just that row
+        for row in self.block_store:
+            if row[0] == block_index:
+                row[4] = self.get_block_status(block_index, self.block_mgr.get_block(block_index))
+                break
+    
     def populate_blocks_view(self):
         """Populate block manager view with current data"""
         if not self.block_mgr:
             return False
         
         # Update stats
-        total_blocks = self.block_mgr.total_blocks
-        my_completed = len(self.scan_db.conn.execute('SELECT * FROM my_scanned').fetchall())
-        pool_scanned = len(self.scan_db.conn.execute('SELECT * FROM pool_scanned').fetchall())
-        remaining = total_blocks - my_completed - pool_scanned
+        self.update_block_counts()
         
-        self.total_blocks_label.set_text(f"{total_blocks:,}")
-        self.remaining_blocks_label.set_text(f"{remaining:,}")
+        # Clear and populate TreeView - detached, so rows don't signal the view one by one
+        store = self.block_store
+        self.block_tree_view.set_model(None)
+        store.clear()
+        columns = list(range(5))
         
-        # Clear and populate TreeView
-        self.block_store.clear()
+        # Unsorted while filling - one sort at the end instead of one per inserted row
+        sort_column, sort_order = store.get_sort_column_id()
+        store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
         
         # Show blocks around current position (40 blocks: 20 before, current, 19 after)
         start_index = max(0, self.current_block_index - 20)
         end_index = min(self.block_mgr.total_blocks, self.current_block_index + 20)
         
+        # Every block but a clipped last one has the same size - format it once
+        full_size = self.block_mgr.block_size
+        full_size_text = f"{full_size:,}"
+        
         for i in range(start_index, end_index):
             block = self.block_mgr.get_block(i)
-            scanned, by_whom = self.scan_db.is_block_scanned(block[0], block[1])
             
             # Calculate block size
             block_size = block[1] - block[0] + 1
+            size_text = full_size_text if block_size == full_size else f"{block_size:,}"
             
-            # Determine status
-            if scanned:
-                status = f"✅ Done ({by_whom})"
-            elif i == self.current_block_index:
-                status = "⚙️ Current"
-            else:
-                status = "⏳ Pending"
-            
-            # Add to store: index, start_hex, end_hex, size, status, start_int, end_int (hidden)
-            self.block_store.append([
+            # Add to store: index, start_hex, end_hex, size, status
+            store.insert_with_valuesv(-1, columns, [
                 i,
                 f"0x{block[0]:X}",
                 f"0x{block[1]:X}",
-                f"{block_size:,}",
-                status,
-                f"{block[0]:X}",  # Hidden: for operations
-                f"{block[1]:X}"   # Hidden: for operations
+                size_text,
+                self.get_block_status(i, block)
             ])
         
+        if sort_column is not None:
+            store.set_sort_column_id(sort_column, sort_order)
+        self.block_tree_view.set_model(store)
         return False
     
     
     def populate_exclusions_view(self):
         """Populate exclusions view with scanned ranges"""
-        buffer = self.exclusions_view.get_buffer()
-        
         # Get actual stats
         stats = self.scan_db.get_stats()
+        my_blocks = self.scan_db.get_my_blocks(with_keys=True)
+        pool_blocks = self.scan_db.get_pool_blocks()
         
-        text = "EXCLUDED RANGES\n"
-        text += "=" * 80 + "\n"
-        text += f"📊 CURRENT STATUS (from database):\n"
-        text += f"   Pool Exclusions: {stats['pool_blocks']} blocks\n"
-        text += f"   My Completed: {stats['my_blocks']} blocks\n"
-        text += f"   Total: {stats['total_blocks']} blocks\n"
-        text += "=" * 80 + "\n\n"
-        
-        # My scanned blocks
-        text += "MY SCANNED BLOCKS:\n"
-        text += "-" * 80 + "\n"
-        cursor = self.scan_db.conn.cursor()
-        cursor.execute('SELECT * FROM my_scanned ORDER BY block_start')
-        my_blocks = cursor.fetchall()
-        
-        for block in my_blocks:  # Show ALL blocks
-            # block[0] and block[1] are already hex strings, block[3] is keys_checked
-            text += f"0x{block[0]} → 0x{block[1]} (Keys: {block[3]:,})\n"
-        
-        text += f"\nTotal my blocks: {len(my_blocks)} (should match {stats['my_blocks']} above)\n\n"
-        
-        # Pool scanned blocks
-        text += "POOL SCANNED BLOCKS:\n"
-        text += "-" * 80 + "\n"
-        cursor.execute('SELECT * FROM pool_scanned ORDER BY block_start')
-        pool_blocks = cursor.fetchall()
-        
-        for block in pool_blocks:  # Show ALL blocks
-            # block[0] and block[1] are already hex strings
-            text += f"0x{block[0]} → 0x{block[1]}\n"
-        
-        text += f"\nTotal pool blocks: {len(pool_blocks)} (should match {stats['pool_blocks']} above)\n"
+        summary = (f"📊 CURRENT STATUS (from database):\n"
+                   f"   Pool Exclusions: {stats['pool_blocks']} blocks | "
+                   f"My Completed: {stats['my_blocks']} blocks | "
+                   f"Total: {stats['total_blocks']} blocks\n"
+                   f"   Listed below: {len(my_blocks)} my blocks, {len(pool_blocks)} pool blocks")
         
         if len(pool_blocks) != stats['pool_blocks']:
-            text += f"\n⚠️ WARNING: Mismatch! List shows {len(pool_blocks)} but stats show {stats['pool_blocks']}\n"
-            text += f"   This might indicate duplicate entries or database corruption.\n"
+            summary += (f"\n⚠️ WARNING: Mismatch! List shows {len(pool_blocks)} but stats show {stats['pool_blocks']}\n"
+                        f"   This might indicate duplicate entries or database corruption.")
+        
+        self.exclusions_summary_label.set_text(summary)
+        
+        # Refill detached and unsorted, like the block list - the TreeView only
+        # renders visible rows, however many blocks there are
+        store = self.exclusions_store
+        self.exclusions_view.set_model(None)
+        store.clear()
+        columns = list(range(6))
+        
+        sort_column, sort_order = store.get_sort_column_id()
+        store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID, Gtk.SortType.ASCENDING)
+        
+        # Add to store: source, start_hex, end_hex, keys, start/end sort keys - ALL blocks
+        for block_start, block_end, keys_checked in my_blocks:
+            store.insert_with_valuesv(-1, columns, [
+                "Me", f"0x{block_start:X}", f"0x{block_end:X}", keys_checked,
+                f"{block_start:032X}", f"{block_end:032X}"
+            ])
+        
+        # Pool rows carry no key count - 0 sorts them with unchecked blocks, shown blank
+        for block_start, block_end in pool_blocks:
+            store.insert_with_valuesv(-1, columns, [
+                "Pool", f"0x{block_start:X}", f"0x{block_end:X}", 0,
+                f"{block_start:032X}", f"{block_end:032X}"
+            ])
         
-        buffer.set_text(text)
+        if sort_column is not None:
+            store.set_sort_column_id(sort_column, sort_order)
+        self.exclusions_view.set_model(store)
         return False
     
+    def render_keys_checked(self, column, renderer, model, tree_iter, data):
+        """Keys Checked cell - the numeric value with separators, blank for pool rows"""
+        source, keys_checked = model.get(tree_iter, 0, 3)
+        renderer.set_property("text", f"{keys_checked:,}" if source == "Me" else "")
+    
     def on_block_right_click(self, widget, event):
         """Handle right-click on block row"""
         if event.button == 3:  # Right click
@@ -2256,8 +2908,7 @@ class KeyHuntSmartGUI(Gtk.Window):
             model = widget.get_model()
             iter = model.get_iter(path)
             block_index = model.get_value(iter, 0)
-            block_start = model.get_value(iter, 5)  # Hidden column with int value
-            block_end = model.get_value(iter, 6)    # Hidden column with int value
+            block_start, block_end = self.block_mgr.get_block(block_index)  # Bounds follow from the index
             
             # Create context menu
             menu = Gtk.Menu()
@@ -2278,12 +2929,8 @@ class KeyHuntSmartGUI(Gtk.Window):
             return True
         return False
     
-    def on_rescan_block(self, widget, block_index, block_start_hex, block_end_hex):
+    def on_rescan_block(self, widget, block_index, block_start, block_end):
         """Load block into configuration for rescanning"""
-        # Convert hex strings to int
-        block_start = int(block_start_hex, 16) if isinstance(block_start_hex, str) else block_start_hex
-        block_end = int(block_end_hex, 16) if isinstance(block_end_hex, str) else block_end_hex
-        
         # Set range in ACTUAL scan inputs (not default config)
         # Find the actual range input fields in Configuration tab
         if hasattr(self, 'manual_start_entry') and hasattr(self, 'manual_end_entry'):
@@ -2297,9 +2944,7 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.log("⚠️ Range set in config. This will change your default range!", "warning")
         
         # Delete from database
-        cursor = self.scan_db.conn.cursor()
-        cursor.execute('DELETE FROM my_scanned WHERE block_start = ?', (f"{block_start:X}",))
-        self.scan_db.conn.commit()
+        self.scan_db.delete_my_block(block_start)
         self.cache_dirty = True
         
         # Clear state file so block starts from 0%
@@ -2313,19 +2958,15 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.log("   Deleted from completed blocks + cleared progress", "info")
         self.log("   Click 'Start' to rescan from 0%", "info")
         
-        # Refresh block list
-        self.populate_blocks_view()
+        # Refresh just this block's row
+        self.refresh_block_row(block_index)
         
         # Switch to Configuration tab
         notebook = self.get_children()[0]  # Main notebook
         notebook.set_current_page(0)  # Configuration tab
     
-    def on_delete_block(self, widget, block_index, block_start_hex, block_end_hex):
+    def on_delete_block(self, widget, block_index, block_start, block_end):
         """Delete block from database with confirmation"""
-        # Convert hex strings to int
-        block_start = int(block_start_hex, 16) if isinstance(block_start_hex, str) else block_start_hex
-        block_end = int(block_end_hex, 16) if isinstance(block_end_hex, str) else block_end_hex
-        
         # Confirmation dialog
         dialog = Gtk.MessageDialog(
             transient_for=self,
@@ -2345,9 +2986,7 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         if response == Gtk.ResponseType.YES:
             # Delete from database
-            cursor = self.scan_db.conn.cursor()
-            cursor.execute('DELETE FROM my_scanned WHERE block_start = ?', (f"{block_start:X}",))
-            self.scan_db.conn.commit()
+            self.scan_db.delete_my_block(block_start)
             self.cache_dirty = True
             
             # IMPORTANT: Clear state file if this is the current block
@@ -2362,8 +3001,8 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.log(f"🗑️ Deleted block #{block_index} from database", "warning")
             self.log(f"   Block is now marked as unscanned", "info")
             
-            # Refresh block list
-            self.populate_blocks_view()
+            # Refresh just this block's row
+            self.refresh_block_row(block_index)
             
             # Update visualization
             if self.progress_drawing:
@@ -2379,11 +3018,8 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.populate_exclusions_view()
         self.log("🔄 Exclusion list refreshed", "success")
     
-    def show_match_alert(self, match_line):
-        """Show BIG alert when a match is found! 🎉"""
-        import subprocess
-        
-        # Play system beep (multiple times!)
+    def play_match_sound(self):
+        """Play the match sound (multiple times!) - blocking, run it off the main loop"""
         for _ in range(5):
             try:
                 subprocess.run(['paplay', '/usr/share/sounds/freedesktop/stereo/complete.oga'], 
@@ -2394,6 +3030,11 @@ class KeyHuntSmartGUI(Gtk.Window):
                     print('\a' * 10)  # System beep
                 except:
                     pass
+    
+    def show_match_alert(self, match_line):
+        """Show BIG alert when a match is found! 🎉"""
+        # Play system beep on its own thread - the dialog shows up right away
+        threading.Thread(target=self.play_match_sound, daemon=True).start()
         
         # Create popup dialog
         dialog = Gtk.MessageDialog(
@@ -2432,6 +3073,9 @@ class KeyHuntSmartGUI(Gtk.Window):
         if self.is_running:
             self.log("⚠️ Already running, ignoring duplicate start", "warning")
             return
+        if self.autotune_running:
+            self.log("⚠️ Grid autotune in progress - start once it finishes", "warning")
+            return
         
         # Initialize block manager
         try:
@@ -2471,14 +3115,9 @@ class KeyHuntSmartGUI(Gtk.Window):
         self.is_running = True
         self.start_time = datetime.now()
         
-        # Find next unscanned block (this will start the thread)
+        # Find next unscanned block - the search starts once one is found
         self.find_next_block()
         
-        if self.current_block is None:
-            self.log("✅ All blocks scanned!", "success")
-            self.is_running = False
-            return
-        
         # Refresh block cache for visualizations
         self.refresh_block_cache()
         
@@ -2494,60 +3133,152 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         self.log("🚀 Starting search...", "success")
         
-        # NOTE: find_next_block() already started the thread, don't start again!
+        # NOTE: find_next_block() starts the search thread, don't start again!
         
         # Start runtime timer
         GLib.timeout_add(1000, self.update_runtime)
     
-    def find_next_block(self):
-        """Find next unscanned block (yields to UI every 100 blocks)"""
-        checks_per_batch = 100  # Check max 100 blocks before yielding to UI
-        checks_done = 0
+    def find_next_block(self, on_found=None):
+        """Search for the next unscanned block on a worker thread
+        
+        The result is claimed back on the main loop, which then calls
+        on_found - by default the search of the new block is started.
+        """
+        if not self.block_mgr:
+            return
+        on_found = on_found or self.start_block_search
+        
+        # One search at a time - a request made mid-search (Start clicked
+        # right after Stop) is deferred and re-run once the first reports back
+        if self.find_pending:
+            self.find_deferred = on_found
+            return
+        
+        # Widget state is read here, on the main loop
+        block_mgr = self.block_mgr
+        exclusions = self.get_pattern_exclusions()
+        
+        self.find_pending = True
+        self.find_on_found = on_found
+        thread = threading.Thread(target=self._find_next_block_worker,
+                                  args=(self.find_generation, block_mgr, self.current_block_index,
+                                        exclusions, on_found),
+                                  daemon=True)
+        thread.start()
+    
+    def cancel_next_block_search(self):
+        """Make sure the search in flight never claims a block or starts KeyHunt
         
-        while self.current_block_index < self.block_mgr.total_blocks:
-            block = self.block_mgr.get_block(self.current_block_index)
-            scanned, by_whom = self.scan_db.is_block_scanned(block[0], block[1])
+        Returns the on_found it would have called (None if nothing was pending).
+        """
+        on_found = (self.find_deferred or self.find_on_found) if self.find_pending else None
+        self.find_generation += 1
+        self.find_deferred = None
+        return on_found
+    
+    def _find_next_block_worker(self, generation, block_mgr, index, exclusions, on_found):
+        """Scan forward from index and hand the first usable block to the main loop"""
+        found = None
+        failed = False
+        try:
+            check_patterns = any(exclusions)
             
-            # Check if already scanned
-            if scanned:
-                self.current_block_index += 1
-                checks_done += 1
-                
-                # Yield to UI every N blocks to prevent freeze
-                if checks_done >= checks_per_batch:
-                    self.log(f"🔍 Checked {checks_done} blocks, continuing search...", "info")
-                    GLib.timeout_add(10, self.find_next_block)  # Continue after 10ms
-                    return
-                continue
+            # Scanned blocks as index runs - skipped in one jump, no per-block probe.
+            # Built here, off the main loop (cached until the next write)
+            run_firsts, run_lasts = self.scan_db.get_scanned_block_runs(block_mgr)
             
-            # Check pattern exclusions
-            skip_pattern, pattern_reason = self.should_skip_block_by_pattern(block[0], block[1])
-            if skip_pattern:
-                self.current_block_index += 1
-                checks_done += 1
-                
-                # Yield to UI every N blocks to prevent freeze
-                if checks_done >= checks_per_batch:
-                    self.log(f"🔍 Checked {checks_done} blocks (skipped {pattern_reason}), continuing...", "info")
-                    GLib.timeout_add(10, self.find_next_block)  # Continue after 10ms
-                    return
-                continue
+            # All full blocks share their low digits - if those trip a pattern rule,
+            # classify every block at once and only check the clipped last one
+            last_index = block_mgr.total_blocks - 1
+            if (check_patterns and index < last_index
+                    and self.pattern_excludes_every_block(exclusions)):
+                self.log(f"🔍 Pattern filter excludes blocks #{index}-#{last_index - 1} "
+                         f"(shared low digits), checking last block...", "info")
+                index = last_index
             
-            # Block is good - use it!
-            self.current_block = block
-            self.keys_checked = 0  # Reset progress for new block
-            self.log(f"📍 Next block: #{self.current_block_index} ({hex(block[0])} - {hex(block[1])})", "info")
-            self.block_value.set_text(f"#{self.current_block_index}")
+            skipped = 0
+            while index < block_mgr.total_blocks:
+                # Check if already scanned - jump past the whole run
+                run = bisect.bisect_right(run_firsts, index) - 1
+                if run >= 0 and index <= run_lasts[run]:
+                    index = run_lasts[run] + 1
+                    continue
+                
+                # Check pattern exclusions
+                if check_patterns:
+                    block = block_mgr.get_block(index)
+                    if self.should_skip_block_by_pattern(block[0], block[1], exclusions)[0]:
+                        index += 1
+                        skipped += 1
+                        continue
+                
+                found = index
+                break
             
-            # Start the search thread
-            thread = threading.Thread(target=self.run_block_search, daemon=True)
-            thread.start()
-            return
+            if skipped:
+                self.log(f"🔍 Skipped {skipped:,} blocks by pattern filter", "info")
+        except Exception as e:
+            self.log(f"❌ Next-block search failed: {e}", "error")
+            found = None
+            failed = True
+        finally:
+            # Always reported back - find_pending must never stay set
+            GLib.idle_add(self._on_next_block_found, generation, block_mgr, found, on_found, failed)
+    
+    def _on_next_block_found(self, generation, block_mgr, index, on_found, failed=False):
+        """Claim the block found by _find_next_block_worker (main loop)"""
+        self.find_pending = False
+        self.find_on_found = None
+        deferred, self.find_deferred = self.find_deferred, None
+        
+        # Paused/stopped, or the range or puzzle changed meanwhile - the index
+        # means nothing now, but a request made since still has to run
+        if (generation != self.find_generation or not self.is_running
+                or block_mgr is not self.block_mgr):
+            if deferred and self.is_running:
+                self.find_next_block(deferred)
+            return False
         
-        # Reached end of blocks
-        self.current_block = None
-        self.log("✅ All blocks scanned!", "success")
-        self.is_running = False
+        # Latest request wins - the found block serves it just as well
+        on_found = deferred or on_found
+        
+        if failed:
+            self.current_block = None
+            self.on_stop(None)
+            return False
+        
+        if index is None:
+            # Reached end of blocks
+            self.current_block = None
+            self.log("✅ All blocks scanned!", "success")
+            self.on_stop(None)
+            return False
+        
+        block = self.block_mgr.get_block(index)
+        self.current_block_index = index
+        self.current_block = block
+        self.keys_checked = 0  # Reset progress for new block
+        self.log(f"📍 Next block: #{index} (0x{block[0]:X} - 0x{block[1]:X})", "info")
+        self.block_value.set_text(f"#{index}")
+        
+        # Paused meanwhile - Resume starts the search of the claimed block
+        if not self.is_paused:
+            on_found()
+        return False
+    
+    def report_match(self, line):
+        """Count, log and alert a KeyHunt match line - safe from any thread"""
+        self.matches_found += 1
+        GLib.idle_add(self.matches_value.set_text, str(self.matches_found))
+        self.log(f"🎉 MATCH: {line}", "match")
+        
+        # 🎉 JACKPOT ALERT! 🎉
+        GLib.idle_add(self.show_match_alert, line)
+    
+    def start_block_search(self):
+        """Start the search of the current block on its own thread"""
+        thread = threading.Thread(target=self.run_block_search, daemon=True)
+        thread.start()
     
     def run_block_search(self):
         """Search current block"""
@@ -2564,17 +3295,17 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         keyhunt_error = False  # Track if KeyHunt had errors
         lines_read = 0  # Count lines read
+        keys_in_block = block_end - block_start + 1  # Fixed for this run - not per line
         
         try:
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=0  # Raw pipe - _iter_pipe_lines does its own chunking
             )
             
-            for line in iter(self.process.stdout.readline, ''):
+            for line in _iter_pipe_lines(self.process.stdout):
                 if not self.is_running or self.is_paused:
                     break
                 
@@ -2585,14 +3316,9 @@ class KeyHuntSmartGUI(Gtk.Window):
                     # CRITICAL: Errors and matches
                     if 'Wrong args' in line or 'ERROR' in line or 'Error:' in line:
                         keyhunt_error = True
-                        GLib.idle_add(self.log, f"🚨 ERROR: {line}", "error")
+                        self.log(f"🚨 ERROR: {line}", "error")
                     elif 'PubAddress:' in line or 'Priv' in line:
-                        self.matches_found += 1
-                        GLib.idle_add(self.matches_value.set_text, str(self.matches_found))
-                        GLib.idle_add(self.log, f"🎉 MATCH: {line}", "match")
-                        
-                        # 🎉 JACKPOT ALERT! 🎉
-                        GLib.idle_add(self.show_match_alert, line)
+                        self.report_match(line)
                         
                         # 🛑 AUTO-STOP: We found it! Stop searching!
                         self.log("🛑 AUTO-STOPPING: Match found!", "success")
@@ -2600,60 +3326,28 @@ class KeyHuntSmartGUI(Gtk.Window):
                         if self.process:
                             self.process.terminate()
                     else:
-                        # Parse speed and keys
-                        speed_match = re.search(r'([\d.]+)\s*Mk/s', line)
-                        if speed_match:
-                            speed = float(speed_match.group(1))
-                            GLib.idle_add(self.speed_value.set_text, f"{speed:.2f} Mk/s")
+                        # Parse speed and keys in one pass - the first of each wins
+                        fields = {}
+                        for field in _KEYHUNT_STAT_RE.finditer(line):
+                            fields.setdefault(field.lastgroup, field.group(field.lastgroup))
+                        
+                        if 'speed' in fields:
+                            self.queue_search_ui('speed', float(fields['speed']))
                         
-                        keys_match = re.search(r'T:\s*([\d,]+)', line)
-                        if keys_match:
-                            keys_str = keys_match.group(1).replace(',', '')
+                        if 'keys' in fields:
+                            keys_str = fields['keys'].replace(',', '')
                             self.session_keys = int(keys_str)
                             
-                            # Display total progress (previous + current session)
+                            # Display total progress (previous + current session) -
+                            # progress bar and stats are derived when the UI flushes
                             total_keys = self.keys_checked + self.session_keys
-                            GLib.idle_add(self.keys_value.set_text, f"{total_keys:,}")
-                            
-                            # Update current block progress bar
-                            if self.current_block:
-                                block_start, block_end = self.current_block
-                                keys_in_block = block_end - block_start + 1
-                                progress = min(1.0, total_keys / keys_in_block)
-                                
-                                GLib.idle_add(self.current_block_progressbar.set_fraction, progress)
-                                GLib.idle_add(self.current_block_progressbar.set_text, f"{progress * 100:.2f}%")
-                                
-                                # Update stats
-                                remaining = keys_in_block - total_keys
-                                eta_seconds = remaining / (self.current_speed * 1_000_000) if self.current_speed > 0 else 0
-                                eta_minutes = eta_seconds / 60
-                                
-                                stats_text = (
-                                    f"<span size='small'>"
-                                    f"Checked: <b>{total_keys:,}</b> / {keys_in_block:,} keys | "
-                                    f"Remaining: <b>{remaining:,}</b> | "
-                                    f"ETA: <b>{eta_minutes:.1f} min</b>"
-                                    f"</span>"
-                                )
-                                GLib.idle_add(self.current_block_stats.set_markup, stats_text)
-                            
-                            # AUTO-STOP: Check if we've completed the block
-                            if self.current_block:
-                                block_start, block_end = self.current_block
-                                keys_in_block = block_end - block_start + 1
-                                
-                                # If total keys checked >= block size, we're done!
-                                if total_keys >= keys_in_block:
-                                    self.log(f"✅ Block complete! Checked {total_keys:,} / {keys_in_block:,} keys", "success")
-                                    self.is_running = False
-                                    if self.process:
-                                        self.process.terminate()
-                                    # Will be marked complete after process exits
+                            self.queue_search_ui('keys', (total_keys, keys_in_block))
+                            # No per-line completion test - the closed --range
+                            # makes KeyHunt exit by itself at block_end
                         
                         # LOG: Only log lines with speed data (every 2 seconds)
                         if 'Mk/s' in line or 'GPU' in line or 'Start' in line:
-                            GLib.idle_add(self.log, line, "info")
+                            self.log(line, "info")
             
             # Wait for process to actually exit
             if self.process:
@@ -2661,30 +3355,40 @@ class KeyHuntSmartGUI(Gtk.Window):
                     self.process.wait(timeout=5)
                     exit_code = self.process.returncode
                 except subprocess.TimeoutExpired:
-                    GLib.idle_add(self.log, "⏱️ Process timeout waiting for exit", "warning")
+                    self.log("⏱️ Process timeout waiting for exit", "warning")
                     exit_code = -1
             else:
                 exit_code = -1  # Process was terminated
             
-            GLib.idle_add(self.log, f"🔍 Process exited: code={exit_code}, lines={lines_read}, errors={keyhunt_error}", "info")
+            self.log(f"🔍 Process exited: code={exit_code}, lines={lines_read}, errors={keyhunt_error}", "info")
+            
+            # Cheap end-of-range check on the last parsed key count - a block
+            # KeyHunt fully swept counts even if it then exited non-zero or was killed
+            range_swept = self.keys_checked + self.session_keys >= keys_in_block
             
             # Only mark block complete if:
             # 1. No errors detected
             # 2. Not manually paused (is_paused = False)
-            # 3. Read at least 10 lines of output (not just help text)
-            # NOTE: We allow exit_code -15 (SIGTERM) because we auto-terminate when block completes
+            # 3. KeyHunt exited by itself (code 0) at the end of the closed range,
+            #    or its key count already reached the end of the block
+            # 4. Read at least 10 lines of output (not just help text)
             if (not self.is_paused and 
                 not keyhunt_error and 
-                (exit_code == 0 or exit_code == -15) and  # Allow our own termination
+                (exit_code == 0 or range_swept) and
                 lines_read >= 10):
+                if exit_code != 0:
+                    self.log(f"✅ Block range fully swept - completing despite exit code {exit_code}", "info")
                 GLib.idle_add(self.on_block_completed)
+            elif (self.is_paused or not self.is_running) and not keyhunt_error:
+                # Paused or stopped by the user - progress is saved, nothing failed
+                self.log(f"⏹ Block #{self.current_block_index} interrupted - not marked complete", "info")
             else:
                 reason = []
                 if self.is_paused:
                     reason.append("PAUSED")
                 if keyhunt_error:
                     reason.append("ERROR DETECTED")
-                if exit_code not in [0, -15]:
+                if exit_code != 0:
                     reason.append(f"EXIT CODE {exit_code}")
                 if lines_read < 10:
                     reason.append(f"TOO FEW LINES ({lines_read})")
@@ -2697,8 +3401,8 @@ class KeyHuntSmartGUI(Gtk.Window):
                 
                 if startup_failure and self.retry_count < 3:
                     self.retry_count += 1
-                    GLib.idle_add(self.log, f"⚠️ Block start failed (attempt {self.retry_count}/3) - GPU might be busy", "warning")
-                    GLib.idle_add(self.log, f"🔄 Retrying in 3 seconds...", "info")
+                    self.log(f"⚠️ Block start failed (attempt {self.retry_count}/3) - GPU might be busy", "warning")
+                    self.log(f"🔄 Retrying in 3 seconds...", "info")
                     time.sleep(3)
                     # Retry the same block
                     thread = threading.Thread(target=self.run_block_search, daemon=True)
@@ -2706,12 +3410,12 @@ class KeyHuntSmartGUI(Gtk.Window):
                 else:
                     # Real failure or max retries
                     self.retry_count = 0
-                    GLib.idle_add(self.log, f"❌ Block NOT completed: {', '.join(reason)}", "error")
-                    GLib.idle_add(self.log, "🛑 STOPPING - Fix the issue before restarting!", "error")
+                    self.log(f"❌ Block NOT completed: {', '.join(reason)}", "error")
+                    self.log("🛑 STOPPING - Fix the issue before restarting!", "error")
                     self.is_running = False
             
         except Exception as e:
-            GLib.idle_add(self.log, f"❌ Exception: {e}", "error")
+            self.log(f"❌ Exception: {e}", "error")
             self.is_running = False
     
     def on_block_completed(self):
@@ -2740,33 +3444,40 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.current_block_index += 1
             self.keys_checked = 0
             
-            # Find next block
-            self.find_next_block()
-            
-            if self.current_block:
-                # CRITICAL: Terminate old process before starting new block
-                if self.process:
-                    try:
-                        self.process.terminate()
-                        self.process.wait(timeout=5)
-                        self.log("🛑 Previous block process terminated", "info")
-                    except:
-                        try:
-                            self.process.kill()
-                            self.log("🛑 Previous block process killed (forced)", "warning")
-                        except:
-                            pass
-                    self.process = None
-                
-                # Small delay to ensure GPU is freed
-                time.sleep(2)
-                
-                # Continue with next block
-                thread = threading.Thread(target=self.run_block_search, daemon=True)
-                thread.start()
-            else:
-                self.log("🎉 ALL BLOCKS COMPLETED!", "success")
-                self.on_stop(None)
+            # Find next block - with none left, the search stops itself
+            self.find_next_block(self.continue_with_next_block)
+    
+    def continue_with_next_block(self):
+        """Move on to the freshly found block after a completed one"""
+        # Retiring the old process and the GPU settle delay happen on the
+        # search thread, not the main loop
+        previous_process, self.process = self.process, None
+        thread = threading.Thread(target=self.start_next_block_search,
+                                  args=(previous_process,), daemon=True)
+        thread.start()
+    
+    def start_next_block_search(self, previous_process):
+        """Retire the previous block's KeyHunt process, then search the current block"""
+        # CRITICAL: Terminate old process before starting new block - a closed
+        # range usually ends on its own, and an exited process holds no GPU
+        if previous_process and previous_process.poll() is None:
+            try:
+                previous_process.terminate()
+                previous_process.wait(timeout=5)
+                self.log("🛑 Previous block process terminated", "info")
+            except:
+                try:
+                    previous_process.kill()
+                    self.log("🛑 Previous block process killed (forced)", "warning")
+                except:
+                    pass
+            
+            # Small delay to ensure GPU is freed
+            time.sleep(2)
+        
+        # The UI stays live during the delay - honour a Stop/Pause pressed meanwhile
+        if self.is_running and not self.is_paused:
+            self.run_block_search()
     
     def on_pause(self, button):
         """Pause searching"""
@@ -2781,6 +3492,9 @@ class KeyHuntSmartGUI(Gtk.Window):
             if self.process:
                 self.process.terminate()
             
+            # A block still being looked for is looked for again on Resume
+            self.find_interrupted = self.cancel_next_block_search()
+            
             self.save_current_state()
             self.log(f"⏸ Paused - Progress saved: {self.keys_checked:,} keys", "warning")
         else:
@@ -2789,6 +3503,12 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.pause_btn_config.set_label("⏸ Pause")
             self.log("▶ Resuming...", "success")
             
+            # Paused mid next-block search - current_block is the finished one
+            if self.find_interrupted:
+                on_found, self.find_interrupted = self.find_interrupted, None
+                self.find_next_block(on_found)
+                return
+            
             thread = threading.Thread(target=self.run_block_search, daemon=True)
             thread.start()
     
@@ -2801,6 +3521,10 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.process.terminate()
             self.process = None
         
+        # A search still in flight must not claim a block for the next Start
+        self.cancel_next_block_search()
+        self.find_interrupted = None
+        
         self.save_current_state()
         
         # Enable both start buttons
@@ -2835,9 +3559,14 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.log("=" * 60, "success")
             
             # Give user time to see the message
-            import time
             time.sleep(1)
         
+        # Don't leave an autotune probe running on the GPU
+        self.autotune_running = False
+        if self.autotune_process:
+            self.autotune_process.terminate()
+        
+        self.stop_pool_scraper()
         self.scan_db.close()
         return False
     
@@ -2864,14 +3593,16 @@ class KeyHuntSmartGUI(Gtk.Window):
         cmd = [keyhunt_bin]
         cmd.extend(['-t', '0'])  # CPU threads: 0 (GPU only)
         cmd.append('-g')         # Enable GPU mode
-        cmd.extend(['--gpui', self.gpu_id.get_text()])  # GPU device ID
-        cmd.extend(['--gpux', '256,256'])  # GPU grid configuration
+        # GPU device IDs ("0" or "0,1") - KeyHunt wants one grid pair per listed GPU
+        gpu_ids = [gpu.strip() for gpu in self.gpu_id.get_text().split(',') if gpu.strip()]
+        cmd.extend(['--gpui', ','.join(gpu_ids)])
+        cmd.extend(['--gpux', ','.join(self.get_gpux(gpu) for gpu in gpu_ids)])  # Autotuned per GPU
         cmd.extend(['-m', 'address'])      # Mode: address matching
         cmd.extend(['--coin', 'BTC'])      # Bitcoin network
         
         # CLOSED RANGE with start and end for automatic block completion
         # KeyHunt will stop when it reaches block_end
-        cmd.extend(['--range', f'{hex(actual_start)[2:]}:{hex(block_end)[2:]}'])
+        cmd.extend(['--range', f'{actual_start:x}:{block_end:x}'])
         
         cmd.extend(['-o', 'Found.txt'])    # Output file
         cmd.append(self.target_entry.get_text())  # Target address (MUST BE LAST!)
@@ -2884,6 +3615,136 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         return cmd
     
+    def load_gpux_cache(self):
+        """Load autotuned --gpux grids keyed by GPU UUID"""
+        try:
+            if os.path.exists(GPUX_CACHE_FILE):
+                with open(GPUX_CACHE_FILE, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning("Error loading %s: %s", GPUX_CACHE_FILE, e)
+        return {}
+    
+    def get_gpu_uuid(self, gpu_id):
+        """UUID for a GPU ID, queried from nvidia-smi once per ID"""
+        if gpu_id not in self.gpu_uuids:
+            self.gpu_uuids[gpu_id] = _query_gpu_uuid(gpu_id)
+        return self.gpu_uuids[gpu_id]
+    
+    def get_gpux(self, gpu_id):
+        """--gpux grid for a GPU - its autotuned value, else the default"""
+        uuid = self.get_gpu_uuid(gpu_id)
+        return self.gpux_cache.get(uuid, GPUX_DEFAULT) if uuid else GPUX_DEFAULT
+    
+    def on_autotune_gpux(self, button):
+        """Probe the candidate --gpux grids on the selected GPU (worker thread)"""
+        if self.is_running or self.autotune_running:
+            self.log("⚠️ Autotune needs an idle GPU - stop the search first", "warning")
+            return
+        if ',' in self.gpu_id.get_text():
+            self.log("⚠️ Autotune one GPU ID at a time - each GPU keeps its own grid", "warning")
+            return
+        
+        try:
+            range_start = int(self.range_start.get_text(), 16)
+            range_end = int(self.range_end.get_text(), 16)
+        except ValueError:
+            self.log("❌ Autotune: invalid range", "error")
+            return
+        
+        # Widget values are read here - the probes run off the main loop
+        self.autotune_running = True
+        self.autotune_btn.set_sensitive(False)
+        thread = threading.Thread(
+            target=self.autotune_gpux,
+            args=(self.keyhunt_path.get_text(), self.gpu_id.get_text(),
+                  self.target_entry.get_text(), range_start, range_end),
+            daemon=True
+        )
+        thread.start()
+    
+    def autotune_gpux(self, keyhunt_bin, gpu_id, target, range_start, range_end):
+        """Run KeyHunt briefly with each candidate grid and cache the fastest"""
+        try:
+            self.log(f"⚡ Autotuning --gpux on GPU {gpu_id}: {len(GPUX_CANDIDATES)} grids "
+                     f"x {GPUX_PROBE_SECONDS}s", "info")
+            
+            speeds = {}
+            for gpux in GPUX_CANDIDATES:
+                speed = self.probe_gpux_speed(keyhunt_bin, gpu_id, gpux, target,
+                                              range_start, range_end)
+                if speed is None:
+                    self.log("🛑 Autotune stopped - no grid saved", "warning")
+                    return
+                self.log(f"   --gpux {gpux}: {speed:.2f} Mk/s", "info")
+                if speed > 0:
+                    speeds[gpux] = speed
+            
+            if not speeds:
+                self.log("❌ Autotune: KeyHunt reported no speed - keeping current grid", "error")
+                return
+            
+            best = max(speeds, key=speeds.get)
+            self.log(f"✅ Fastest grid: --gpux {best} ({speeds[best]:.2f} Mk/s)", "success")
+            
+            uuid = self.get_gpu_uuid(gpu_id)
+            if not uuid:
+                self.log("⚠️ nvidia-smi unavailable - grid not saved for this GPU", "warning")
+                return
+            
+            self.gpux_cache[uuid] = best
+            with open(GPUX_CACHE_FILE, 'w') as f:
+                json.dump(self.gpux_cache, f, indent=2)
+        except Exception as e:
+            self.log(f"❌ Autotune failed: {e}", "error")
+        finally:
+            self.autotune_running = False
+            GLib.idle_add(self.autotune_btn.set_sensitive, True)
+    
+    def probe_gpux_speed(self, keyhunt_bin, gpu_id, gpux, target, range_start, range_end):
+        """Last Mk/s KeyHunt reports within GPUX_PROBE_SECONDS for one grid
+        
+        Returns None when autotune must stop: a match was found (each probe
+        is a real search) or the window is closing.
+        """
+        if not self.autotune_running:
+            return None  # Window closed between probes
+        
+        cmd = [keyhunt_bin, '-t', '0', '-g', '--gpui', gpu_id, '--gpux', gpux,
+               '-m', 'address', '--coin', 'BTC',
+               '--range', f'{range_start:x}:{range_end:x}',
+               '-o', 'Found.txt', target]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+        self.autotune_process = process  # Terminated by on_window_close
+        
+        # Ends the probe even if KeyHunt goes quiet - the read loop then sees EOF
+        timer = threading.Timer(GPUX_PROBE_SECONDS, process.terminate)
+        timer.start()
+        
+        speed = 0.0
+        matched = False
+        try:
+            for line in _iter_pipe_lines(process.stdout):
+                if 'PubAddress:' in line or 'Priv' in line:
+                    # Found.txt has it too - but the user must hear about it now
+                    self.report_match(line.strip())
+                    matched = True
+                    process.terminate()
+                elif 'Mk/s' in line:
+                    for field in _KEYHUNT_STAT_RE.finditer(line):
+                        if field.lastgroup == 'speed':
+                            speed = float(field.group('speed'))  # Latest = warmed up
+                            break
+        finally:
+            timer.cancel()
+            process.terminate()
+            process.wait()
+            self.autotune_process = None
+        
+        if matched or not self.autotune_running:
+            return None
+        return speed
+    
     def update_buttons(self):
         """Update button states based on current status"""
         if self.is_running and not self.is_paused:
@@ -2942,33 +3803,19 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.log(line, "match")
             return
         
-        # Parse speed
-        speed_match = re.search(r'([\d.]+)\s*[MK]k/s', line)
+        # Parse speed - substring test first, most lines are banner text
+        speed_match = 'k/s' in line and _KEYHUNT_SPEED_RE.search(line)
         if speed_match:
             self.current_speed = float(speed_match.group(1))
             self.speed_value.set_text(f"{self.current_speed:.2f} Mk/s")
         
         # Parse keys checked
-        keys_match = re.search(r'T:\s*([\d,]+)', line)
+        keys_match = 'T:' in line and _KEYHUNT_KEYS_RE.search(line)
         if keys_match:
             keys_str = keys_match.group(1).replace(',', '')
             self.keys_checked = int(keys_str)
             self.keys_value.set_text(self.format_number(self.keys_checked))
             
-            # Check if we've reached the block end (for open-ended searches)
-            if self.current_block and self.keys_checked > 0:
-                block_start, block_end = self.current_block
-                keys_to_search = block_end - block_start + 1
-                
-                # If we've checked enough keys, stop and complete the block
-                if self.keys_checked >= keys_to_search:
-                    self.log(f"✅ Block complete! Searched {self.keys_checked:,} keys", "success")
-                    self.is_running = False
-                    if self.process:
-                        self.process.terminate()
-                    GLib.idle_add(self.on_block_completed)
-                    return
-            
             # Update progress
             if self.total_keys_in_range > 0:
                 percentage = (self.keys_checked / self.total_keys_in_range) * 100
@@ -3004,13 +3851,31 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         # Update visual progress bar every 5 seconds
         if seconds % 5 == 0:
-            if self.progress_drawing:
-                self.progress_drawing.queue_draw()
-            # Update probability dashboard
-            self.update_probability_dashboard()
+            self.redraw_current_block()
+            # Update probability dashboard - only while its tab is on screen
+            if self.probability_frame.get_mapped():
+                self.update_probability_dashboard()
         
         return True
     
+    def redraw_current_block(self):
+        """Queue a redraw of the progress bar for a current-block progress tick
+        
+        Only keys_checked moves between ticks, so when nothing else changed
+        just the current block's strip is invalidated instead of the full bar.
+        """
+        if not self.progress_drawing or not self.progress_drawing.get_mapped():
+            return  # Drawn fresh when the tab is shown again
+        
+        area = self.current_block_area
+        width = self.progress_drawing.get_allocated_width()
+        if (self.cache_dirty or area is None or area[0] != self.current_block
+                or area[1] != width):
+            self.progress_drawing.queue_draw()
+        else:
+            height = self.progress_drawing.get_allocated_height()
+            self.progress_drawing.queue_draw_area(area[2], 0, area[3], height)
+    
     def format_number(self, num):
         """Format large numbers"""
         if num >= 1e12:
@@ -3026,12 +3891,19 @@ class KeyHuntSmartGUI(Gtk.Window):
         text = self.puzzle_combo.get_active_text()
         if text:
             # Extract number from "#71 - 71 bits - 7.1 BTC"
-            import re
-            match = re.match(r'#(\d+)', text)
+            match = _PUZZLE_LABEL_RE.match(text)
             if match:
                 return int(match.group(1))
         return 71  # Default
     
+    def get_preset_range(self, puzzle_num):
+        """Get a preset's keyspace as ints, parsing the hex strings only once"""
+        if puzzle_num not in self.preset_ranges:
+            preset = self.PUZZLE_PRESETS[puzzle_num]
+            self.preset_ranges[puzzle_num] = (int(preset['range_start'], 16),
+                                              int(preset['range_end'], 16))
+        return self.preset_ranges[puzzle_num]
+    
     def on_puzzle_changed(self, combo):
         """Handle puzzle selection change"""
         text = combo.get_active_text()
@@ -3050,6 +3922,17 @@ class KeyHuntSmartGUI(Gtk.Window):
             f"<span size='small' foreground='#CCCCCC'>Database: scan_data_puzzle_{puzzle_num}.db</span>"
         )
     
+    def get_discovery_probability(self, max_age=0.5):
+        """Get the discovery probability, reusing a result younger than max_age seconds"""
+        if self.probability_cache is not None:
+            value, computed_at = self.probability_cache
+            if time.monotonic() - computed_at <= max_age:
+                return value
+        
+        value = self.calculate_discovery_probability()
+        self.probability_cache = (value, time.monotonic())
+        return value
+    
     def calculate_discovery_probability(self):
         """Calculate overall probability of discovering the key"""
         if not self.block_mgr:
@@ -3057,7 +3940,7 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         # Factor 1: Search Space Coverage (0-40 points)
         total_blocks = self.block_mgr.total_blocks
-        my_completed = len(self.scan_db.conn.execute('SELECT * FROM my_scanned').fetchall())
+        my_completed = self.scan_db.count_my_blocks()
         coverage_percent = (my_completed / total_blocks * 100) if total_blocks > 0 else 0
         factor1_score = min(coverage_percent * 0.4, 40)  # Cap at 40 points
         
@@ -3071,19 +3954,13 @@ class KeyHuntSmartGUI(Gtk.Window):
             factor2_score += 3
         
         # Factor 3: Pool Coordination (0-15 points)
-        pool_count = len(self.scan_db.conn.execute('SELECT * FROM pool_scanned').fetchall())
+        pool_count = self.scan_db.count_pool_blocks()
         pool_coverage = (pool_count / total_blocks * 100) if total_blocks > 0 else 0
         # Good if pool has high coverage (less competition)
         factor3_score = min(pool_coverage * 0.15, 15)
         
-        # Factor 4: Search Speed (0-15 points)
-        speed_mks = 0
-        if hasattr(self, 'speed_value'):
-            speed_text = self.speed_value.get_text()
-            try:
-                speed_mks = float(speed_text.replace('Mk/s', '').strip())
-            except:
-                speed_mks = 0
+        # Factor 4: Search Speed (0-15 points) - the parsed value, not the label text
+        speed_mks = self.current_speed
         
         # Score based on speed (>200 Mk/s is good GPU)
         if speed_mks > 200:
@@ -3125,18 +4002,20 @@ class KeyHuntSmartGUI(Gtk.Window):
         
         # Calculate factors
         total_blocks = self.block_mgr.total_blocks
-        my_completed = len(self.scan_db.conn.execute('SELECT * FROM my_scanned').fetchall())
-        pool_count = len(self.scan_db.conn.execute('SELECT * FROM pool_scanned').fetchall())
+        my_completed = self.scan_db.count_my_blocks()
+        pool_count = self.scan_db.count_pool_blocks()
         
         coverage_percent = (my_completed / total_blocks * 100) if total_blocks > 0 else 0
         pool_coverage = (pool_count / total_blocks * 100) if total_blocks > 0 else 0
         
         # Factor 1: Search Space Coverage
         factor1_score = min(coverage_percent * 0.4, 40)
-        self.prob_factor1_value.set_markup(
+        self.set_label_markup(
+            self.prob_factor_values[0],
             f"<span foreground='#4CAF50'>{coverage_percent:.4f}% of keyspace</span>"
         )
-        self.prob_factor1_impact.set_markup(
+        self.set_label_markup(
+            self.prob_factor_impacts[0],
             f"<span size='small' foreground='#4CAF50'>+{factor1_score:.2f}%</span>"
         )
         
@@ -3154,37 +4033,35 @@ class KeyHuntSmartGUI(Gtk.Window):
             factor2_score += 3
         
         if pattern_active:
-            self.prob_factor2_value.set_markup(
+            self.set_label_markup(
+                self.prob_factor_values[1],
                 f"<span foreground='#4CAF50'>{', '.join(pattern_active)} active</span>"
             )
-            self.prob_factor2_impact.set_markup(
+            self.set_label_markup(
+                self.prob_factor_impacts[1],
                 f"<span size='small' foreground='#4CAF50'>+{factor2_score:.2f}%</span>"
             )
         else:
-            self.prob_factor2_value.set_markup("<span foreground='#FF9800'>None active</span>")
-            self.prob_factor2_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
+            self.set_label_markup(self.prob_factor_values[1], "<span foreground='#FF9800'>None active</span>")
+            self.set_label_markup(self.prob_factor_impacts[1], "<span size='small' foreground='#CCCCCC'>+0.00%</span>")
         
         # Factor 3: Pool Coordination
         factor3_score = min(pool_coverage * 0.15, 15)
         if pool_count > 0:
-            self.prob_factor3_value.set_markup(
+            self.set_label_markup(
+                self.prob_factor_values[2],
                 f"<span foreground='#4CAF50'>{pool_coverage:.2f}% pool coverage</span>"
             )
-            self.prob_factor3_impact.set_markup(
+            self.set_label_markup(
+                self.prob_factor_impacts[2],
                 f"<span size='small' foreground='#4CAF50'>+{factor3_score:.2f}%</span>"
             )
         else:
-            self.prob_factor3_value.set_markup("<span foreground='#FF9800'>No pool data</span>")
-            self.prob_factor3_impact.set_markup("<span size='small' foreground='#CCCCCC'>+0.00%</span>")
+            self.set_label_markup(self.prob_factor_values[2], "<span foreground='#FF9800'>No pool data</span>")
+            self.set_label_markup(self.prob_factor_impacts[2], "<span size='small' foreground='#CCCCCC'>+0.00%</span>")
         
         # Factor 4: Search Speed
-        speed_mks = 0
-        if hasattr(self, 'speed_value'):
-            speed_text = self.speed_value.get_text()
-            try:
-                speed_mks = float(speed_text.replace('Mk/s', '').strip())
-            except:
-                pass
+        speed_mks = self.current_speed
         
         if speed_mks > 200:
             factor4_score = 15
@@ -3199,10 +4076,12 @@ class KeyHuntSmartGUI(Gtk.Window):
             factor4_score = 0
             color = '#CCCCCC'
         
-        self.prob_factor4_value.set_markup(
+        self.set_label_markup(
+            self.prob_factor_values[3],
             f"<span foreground='{color}'>{speed_mks:.2f} Mk/s</span>"
         )
-        self.prob_factor4_impact.set_markup(
+        self.set_label_markup(
+            self.prob_factor_impacts[3],
             f"<span size='small' foreground='{color}'>+{factor4_score:.2f}%</span>"
         )
         
@@ -3224,15 +4103,19 @@ class KeyHuntSmartGUI(Gtk.Window):
             factor5_score = 1
         
         time_str = str(timedelta(seconds=int(runtime_seconds)))
-        self.prob_factor5_value.set_markup(
+        self.set_label_markup(
+            self.prob_factor_values[4],
             f"<span foreground='#4CAF50'>{time_str}</span>"
         )
-        self.prob_factor5_impact.set_markup(
+        self.set_label_markup(
+            self.prob_factor_impacts[4],
             f"<span size='small' foreground='#4CAF50'>+{factor5_score:.2f}%</span>"
         )
         
-        # Calculate total probability
+        # Calculate total probability (fresh - the bar redraw below reuses it)
         total_prob = self.calculate_discovery_probability()
+        previous_prob = self.probability_cache[0] if self.probability_cache else None
+        self.probability_cache = (total_prob, time.monotonic())
         
         # Update main probability label
         if total_prob < 10:
@@ -3248,7 +4131,8 @@ class KeyHuntSmartGUI(Gtk.Window):
             color = '#4CAF50'
             status = "High"
         
-        self.probability_label.set_markup(
+        self.set_label_markup(
+            self.probability_label,
             f"<span size='large' weight='bold'>Current Discovery Probability: "
             f"<span foreground='{color}'>{total_prob:.2f}% ({status})</span></span>"
         )
@@ -3281,83 +4165,115 @@ class KeyHuntSmartGUI(Gtk.Window):
             recommendations.append("✅ Excellent setup! Keep searching - you're doing great!")
         
         rec_text = "\n".join([f"• {rec}" for rec in recommendations[:5]])  # Top 5 recommendations
-        self.prob_recommendations.set_markup(
+        self.set_label_markup(
+            self.prob_recommendations,
             f"<span size='small'>{rec_text}</span>"
         )
         
-        # Redraw probability bar
-        if hasattr(self, 'probability_drawing'):
+        # Redraw probability bar - only when the value it shows moved
+        if hasattr(self, 'probability_drawing') and total_prob != previous_prob:
             self.probability_drawing.queue_draw()
     
+    def set_label_markup(self, label, markup):
+        """set_markup, skipped when the label already shows this markup"""
+        if self.label_markup.get(label) != markup:
+            label.set_markup(markup)
+            self.label_markup[label] = markup
+    
     def update_pattern_reduction(self, widget=None):
         """Update estimated search space reduction based on selected patterns"""
-        reduction = 0
+        self.pattern_reduction_label.set_markup(self.PATTERN_REDUCTION_MARKUP[(
+            self.exclude_iter3.get_active(),
+            self.exclude_iter4.get_active(),
+            self.exclude_alphanum.get_active(),
+        )])
+    
+    def has_repeated_chars(self, key, min_repeats=3):
+        """Check if a key's hex digits have N or more repeated characters (ignoring zeros)
         
-        if self.exclude_iter3.get_active():
-            reduction += 60
-        if self.exclude_iter4.get_active():
-            reduction += 40
-        if self.exclude_alphanum.get_active():
-            reduction += 30
+        Works on the integer's nibbles directly (SWAR) - no hex string, no
+        per-digit Python loop.
+        """
+        ones = _nibble_ones(key)
         
-        # Cap at 95% (can't combine additively)
-        reduction = min(reduction, 95)
+        # Bit 0 of nibble i set when digit i equals digit i+1
+        diff = key ^ (key >> 4)
+        same = ones & ~(diff | (diff >> 1) | (diff >> 2) | (diff >> 3))
         
-        self.pattern_reduction_label.set_markup(
-            f"<span foreground='#00FFFF' weight='bold'>"
-            f"Estimated search space reduction: {reduction}%"
-            f"</span>"
-        )
-    
-    def has_repeated_chars(self, hex_string, min_repeats=3):
-        """Check if hex string has N or more repeated characters (ignoring zeros)"""
-        count = 1
-        prev_char = ''
-        
-        for char in hex_string:
-            if char == prev_char:
-                count += 1
-                # IGNORE repeated zeros - they're common in valid ranges
-                if count >= min_repeats and char != '0':
-                    return True
-            else:
-                count = 1
-                prev_char = char
+        # N equal digits in a row = N-1 consecutive "same as next" flags
+        run = same
+        for shift in range(4, (min_repeats - 1) * 4, 4):
+            run &= same >> shift
         
-        return False
+        # IGNORE repeated zeros - they're common in valid ranges
+        nonzero = ones & (key | (key >> 1) | (key >> 2) | (key >> 3))
+        return (run & nonzero) != 0
     
-    def is_all_alpha_or_numeric(self, hex_string):
-        """Check if hex string is entirely letters (A-F) or numbers (0-9)"""
-        has_alpha = any(c in 'ABCDEFabcdef' for c in hex_string)
-        has_numeric = any(c in '0123456789' for c in hex_string)
+    def is_all_alpha_or_numeric(self, key):
+        """Check if a key's hex digits are entirely letters (A-F) or numbers (0-9)"""
+        ones = _nibble_ones(key)
+        
+        # A nibble is A-F when bit 3 is set together with bit 2 or bit 1
+        alpha = ones & (key >> 3) & ((key >> 2) | (key >> 1))
         
         # If it has both, return False (mixed is good)
         # If it has only one type, return True (should exclude)
-        return has_alpha ^ has_numeric  # XOR: true if only one is true
+        return alpha == 0 or alpha == ones
     
-    def should_skip_block_by_pattern(self, block_start, block_end):
-        """Check if block should be skipped based on pattern exclusions"""
-        # Convert to hex strings
-        start_hex = hex(block_start)[2:].upper()
-        end_hex = hex(block_end)[2:].upper()
+    def get_pattern_exclusions(self):
+        """Read the pattern exclusion toggles once: (iter3, iter4, alphanum)"""
+        iter3 = self.exclude_iter3.get_active()
+        # Any run of 4 contains a run of 3, so iter4 adds nothing under iter3
+        iter4 = self.exclude_iter4.get_active() and not iter3
+        return iter3, iter4, self.exclude_alphanum.get_active()
+    
+    def should_skip_block_by_pattern(self, block_start, block_end, exclusions=None):
+        """Check if block should be skipped based on pattern exclusions
+        
+        Pass exclusions from get_pattern_exclusions() when checking many
+        blocks in a row, to skip re-reading the toggle widgets per block.
+        """
+        iter3, iter4, alphanum = exclusions or self.get_pattern_exclusions()
         
         # Check exclude_iter3
-        if self.exclude_iter3.get_active():
-            if self.has_repeated_chars(start_hex, 3) or self.has_repeated_chars(end_hex, 3):
+        if iter3:
+            if self.has_repeated_chars(block_start, 3) or self.has_repeated_chars(block_end, 3):
                 return True, "repeated-3"
         
         # Check exclude_iter4
-        if self.exclude_iter4.get_active():
-            if self.has_repeated_chars(start_hex, 4) or self.has_repeated_chars(end_hex, 4):
+        if iter4:
+            if self.has_repeated_chars(block_start, 4) or self.has_repeated_chars(block_end, 4):
                 return True, "repeated-4"
         
         # Check exclude_alphanum
-        if self.exclude_alphanum.get_active():
-            if self.is_all_alpha_or_numeric(start_hex) or self.is_all_alpha_or_numeric(end_hex):
+        if alphanum:
+            if self.is_all_alpha_or_numeric(block_start) or self.is_all_alpha_or_numeric(block_end):
                 return True, "alphanum-only"
         
         return False, None
     
+    def pattern_excludes_every_block(self, exclusions):
+        """Check if the low hex digits all blocks share already trip a repeat rule
+        
+        block_size is a multiple of 16**k, so every block start keeps the low k
+        digits of range_start and every block end those of range_start - 1.
+        A repeated run inside those digits excludes all blocks at once - except
+        the last, whose end is clipped to range_end.
+        """
+        iter3, iter4, alphanum = exclusions
+        if not (iter3 or iter4):
+            return False
+        
+        # k = trailing zero hex digits of block_size
+        block_size = self.block_mgr.block_size
+        tail_mask = (1 << ((block_size & -block_size).bit_length() - 1) // 4 * 4) - 1
+        start_tail = self.block_mgr.range_start & tail_mask
+        end_tail = (self.block_mgr.range_start - 1) & tail_mask
+        
+        min_repeats = 3 if iter3 else 4
+        return (self.has_repeated_chars(start_tail, min_repeats) or
+                self.has_repeated_chars(end_tail, min_repeats))
+    
     def on_load_preset(self, button):
         """Load preset values for selected puzzle"""
         if self.is_running:
@@ -3411,15 +4327,16 @@ class KeyHuntSmartGUI(Gtk.Window):
         if self.current_puzzle != puzzle_num:
             self.save_current_state()
         
-        # Update puzzle number
-        old_puzzle = self.current_puzzle
-        self.current_puzzle = puzzle_num
-        
         # Switch components to new puzzle
         self.pool_scraper.update_puzzle(puzzle_num)
         self.scan_db.switch_puzzle(puzzle_num)
         self.state_mgr.switch_puzzle(puzzle_num)
         
+        # Update puzzle number last - a scrape that read it earlier sees the
+        # change and drops blocks it may have fetched for the old puzzle
+        old_puzzle = self.current_puzzle
+        self.current_puzzle = puzzle_num
+        
         # Load preset values
         preset = self.PUZZLE_PRESETS[puzzle_num]
         self.target_entry.set_text(preset['address'])
@@ -3482,8 +4399,12 @@ class KeyHuntSmartGUI(Gtk.Window):
                 continue
             
             try:
-                # Try different separators
-                if ':' in line:
+                # Well-formed lines need a single precompiled match
+                match = _MANUAL_RANGE_RE.fullmatch(line)
+                if match:
+                    parts = match.groups()
+                # Otherwise try different separators (for a precise warning)
+                elif ':' in line:
                     parts = line.split(':')
                 elif '-' in line:
                     parts = line.split('-')
@@ -3520,13 +4441,13 @@ class KeyHuntSmartGUI(Gtk.Window):
         text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
         
         if not text.strip():
-            self.manual_status_label.set_markup("<span foreground='#FF9800'>⚠ No ranges entered</span>")
+            self.set_manual_status("⚠ No ranges entered", "warning")
             return
         
         ranges = self.parse_manual_ranges(text)
         
         if not ranges:
-            self.manual_status_label.set_markup("<span foreground='#F44336'>❌ No valid ranges found</span>")
+            self.set_manual_status("❌ No valid ranges found", "error")
             return
         
         # Add to database as pool scanned
@@ -3539,9 +4460,7 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.progress_drawing.queue_draw()
         
         self.log(f"✅ Manual add: {added_count} new, {duplicate_count} duplicates", "success")
-        self.manual_status_label.set_markup(
-            f"<span foreground='#4CAF50'>✅ Added {added_count} new ({duplicate_count} duplicates)</span>"
-        )
+        self.set_manual_status(f"✅ Added {added_count} new ({duplicate_count} duplicates)", "ok")
     
     def on_add_manual_my_ranges(self, button):
         """Add manually entered ranges as my-scanned"""
@@ -3549,18 +4468,17 @@ class KeyHuntSmartGUI(Gtk.Window):
         text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
         
         if not text.strip():
-            self.manual_status_label.set_markup("<span foreground='#FF9800'>⚠ No ranges entered</span>")
+            self.set_manual_status("⚠ No ranges entered", "warning")
             return
         
         ranges = self.parse_manual_ranges(text)
         
         if not ranges:
-            self.manual_status_label.set_markup("<span foreground='#F44336'>❌ No valid ranges found</span>")
+            self.set_manual_status("❌ No valid ranges found", "error")
             return
         
         # Add to database as my scanned (with 0 keys checked since manual)
-        for start, end in ranges:
-            self.scan_db.add_my_block(start, end, 0)
+        self.scan_db.add_my_blocks(ranges, 0)
         self.cache_dirty = True  # Refresh cache
         
         # Update UI
@@ -3569,14 +4487,12 @@ class KeyHuntSmartGUI(Gtk.Window):
             self.progress_drawing.queue_draw()
         
         self.log(f"✅ Added {len(ranges)} ranges as my-scanned (manual)", "success")
-        self.manual_status_label.set_markup(
-            f"<span foreground='#4CAF50'>✅ Added {len(ranges)} ranges as my-scanned</span>"
-        )
+        self.set_manual_status(f"✅ Added {len(ranges)} ranges as my-scanned", "ok")
     
-    def on_import_ranges_file(self, button):
-        """Import ranges from a file"""
+    def create_open_dialog(self, title):
+        """File chooser with Cancel/Open buttons - built once, then hidden and reused"""
         dialog = Gtk.FileChooserDialog(
-            title="Select Ranges File",
+            title=title,
             parent=self,
             action=Gtk.FileChooserAction.OPEN
         )
@@ -3584,75 +4500,99 @@ class KeyHuntSmartGUI(Gtk.Window):
             Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
             Gtk.STOCK_OPEN, Gtk.ResponseType.OK
         )
+        return dialog
+    
+    def on_import_ranges_file(self, button):
+        """Import ranges from a file"""
+        dialog = self.import_dialog
+        if dialog is None:
+            dialog = self.import_dialog = self.create_open_dialog("Select Ranges File")
+            
+            # Add file filters
+            filter_text = Gtk.FileFilter()
+            filter_text.set_name("Text files")
+            filter_text.add_mime_type("text/plain")
+            filter_text.add_pattern("*.txt")
+            dialog.add_filter(filter_text)
+            
+            filter_any = Gtk.FileFilter()
+            filter_any.set_name("All files")
+            filter_any.add_pattern("*")
+            dialog.add_filter(filter_any)
         
-        # Add file filters
-        filter_text = Gtk.FileFilter()
-        filter_text.set_name("Text files")
-        filter_text.add_mime_type("text/plain")
-        filter_text.add_pattern("*.txt")
-        dialog.add_filter(filter_text)
-        
-        filter_any = Gtk.FileFilter()
-        filter_any.set_name("All files")
-        filter_any.add_pattern("*")
-        dialog.add_filter(filter_any)
-        
-        response = dialog.run()
+        try:
+            response = dialog.run()
+            filepath = dialog.get_filename()
+        finally:
+            dialog.hide()
         
         if response == Gtk.ResponseType.OK:
-            filepath = dialog.get_filename()
-            dialog.destroy()
+            # Read and parse on a worker - the result comes back via idle_add
+            self.set_manual_status("⏳ Loading ranges file...", "neutral")
+            thread = threading.Thread(target=self.import_ranges_file, args=(filepath,), daemon=True)
+            thread.start()
+    
+    def import_ranges_file(self, filepath):
+        """Read and parse a ranges file (worker thread - no GTK calls here)"""
+        try:
+            with open(filepath, 'r') as f:
+                content = f.read()
             
-            try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                
-                # Set content in text view
-                buffer = self.manual_input_view.get_buffer()
-                buffer.set_text(content)
-                
-                # Parse to show preview
-                ranges = self.parse_manual_ranges(content)
-                
-                self.log(f"📁 Imported file: {filepath}", "info")
-                self.log(f"   Found {len(ranges)} valid ranges", "info")
-                self.manual_status_label.set_markup(
-                    f"<span foreground='#4CAF50'>✅ Loaded {len(ranges)} ranges from file</span>"
-                )
-                
-            except Exception as e:
-                self.log(f"❌ Error importing file: {e}", "error")
-                self.manual_status_label.set_markup(
-                    f"<span foreground='#F44336'>❌ Error: {e}</span>"
-                )
-        else:
-            dialog.destroy()
+            # Parse to show preview
+            ranges = self.parse_manual_ranges(content)
+        except Exception as e:
+            self.log(f"❌ Error importing file: {e}", "error")
+            GLib.idle_add(self.set_manual_status, f"❌ Error: {e}", "error")
+            return
+        
+        GLib.idle_add(self.on_ranges_file_imported, filepath, content, len(ranges))
+    
+    def on_ranges_file_imported(self, filepath, content, range_count):
+        """Show a parsed ranges file in the manual input view (main loop)"""
+        # Set content in text view
+        buffer = self.manual_input_view.get_buffer()
+        buffer.set_text(content)
+        
+        self.log(f"📁 Imported file: {filepath}", "info")
+        self.log(f"   Found {range_count} valid ranges", "info")
+        self.set_manual_status(f"✅ Loaded {range_count} ranges from file", "ok")
+        return False
+    
+    def set_manual_status(self, text, kind):
+        """Show plain text in the manual status label, colored by a status-<kind> CSS class"""
+        self.manual_status_label.set_label(text)  # No markup to parse
+        
+        if kind != self.manual_status_kind:
+            context = self.manual_status_label.get_style_context()
+            if self.manual_status_kind:
+                context.remove_class(f"status-{self.manual_status_kind}")
+            context.add_class(f"status-{kind}")
+            self.manual_status_kind = kind
     
     def on_clear_manual_input(self, button):
         """Clear manual input text"""
         buffer = self.manual_input_view.get_buffer()
         buffer.set_text("")
-        self.manual_status_label.set_markup("<span foreground='#CCCCCC'>Input cleared</span>")
+        self.set_manual_status("Input cleared", "neutral")
     
     def on_keyhunt_browse(self, button):
         """Browse for KeyHunt binary"""
-        dialog = Gtk.FileChooserDialog(
-            title="Select KeyHunt-Cuda",
-            parent=self,
-            action=Gtk.FileChooserAction.OPEN
-        )
-        dialog.add_buttons(
-            Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
-            Gtk.STOCK_OPEN, Gtk.ResponseType.OK
-        )
+        if self.keyhunt_dialog is None:
+            self.keyhunt_dialog = self.create_open_dialog("Select KeyHunt-Cuda")
+        dialog = self.keyhunt_dialog
         
-        response = dialog.run()
-        if response == Gtk.ResponseType.OK:
-            self.keyhunt_path.set_text(dialog.get_filename())
-        dialog.destroy()
+        try:
+            response = dialog.run()
+            if response == Gtk.ResponseType.OK:
+                self.keyhunt_path.set_text(dialog.get_filename())
+        finally:
+            dialog.hide()
 
 
 def main():
+    # Scraper details go to the terminal; set DEBUG to see example IDs/blocks
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     app = KeyHuntSmartGUI()
     app.connect("destroy", Gtk.main_quit)
     app.show_all()
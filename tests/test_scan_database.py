@@ -0,0 +1,113 @@
+"""ScanDatabase migration of v3.5.0 hex TEXT databases"""
+
+import importlib.util
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'keyhunt_smart_coordinator_v3.5.0.py'
+
+POOL_BLOCKS = [(0x400000000000000000, 0x40000000000fffffff),
+               (0x7fffffffff00000000, 0x7fffffffffffffffff)]
+MY_BLOCKS = [(0x500000000000000000, 0x50000000000fffffff, 268435456)]
+
+
+def load_coordinator():
+    """Import the coordinator script, or None if GTK isn't available"""
+    spec = importlib.util.spec_from_file_location('keyhunt_smart_coordinator', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except (ImportError, ValueError):  # gi missing, or no GTK 3 typelib
+        return None
+    return module
+
+
+coordinator = load_coordinator()
+
+
+@unittest.skipIf(coordinator is None, "requires PyGObject with GTK 3")
+class LegacyMigrationTest(unittest.TestCase):
+    
+    def setUp(self):
+        # ScanDatabase opens scan_data_puzzle_N.db in the working directory
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, self.cwd)
+    
+    def write_legacy_db(self, puzzle_number):
+        """Create a database with the v3.5.0 hex TEXT schema"""
+        conn = sqlite3.connect(f"scan_data_puzzle_{puzzle_number}.db")
+        conn.execute('CREATE TABLE pool_scanned (block_start TEXT PRIMARY KEY, '
+                     'block_end TEXT, scraped_at TEXT)')
+        conn.execute('CREATE TABLE my_scanned (block_start TEXT PRIMARY KEY, '
+                     'block_end TEXT, scanned_at TEXT, keys_checked INTEGER)')
+        conn.executemany('INSERT INTO pool_scanned VALUES (?, ?, ?)',
+                         [(hex(start), hex(end), '2026-01-01T00:00:00') for start, end in POOL_BLOCKS])
+        conn.executemany('INSERT INTO my_scanned VALUES (?, ?, ?, ?)',
+                         [(hex(start), hex(end), '2026-01-01T00:00:00', keys) for start, end, keys in MY_BLOCKS])
+        conn.commit()
+        return conn
+    
+    def assert_migrated(self, db):
+        self.assertEqual(db.get_pool_blocks(), POOL_BLOCKS)
+        self.assertEqual(db.get_my_blocks(with_keys=True), MY_BLOCKS)
+        self.assertEqual(db.get_stats()['total_blocks'], 3)
+        
+        tables = {row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertEqual(tables, {'pool_scanned', 'my_scanned'})
+    
+    def test_migrates_legacy_db(self):
+        self.write_legacy_db(99).close()
+        
+        db = coordinator.ScanDatabase(99)
+        self.assert_migrated(db)
+        
+        # Reopening is a no-op
+        db.close()
+        db = coordinator.ScanDatabase(99)
+        self.addCleanup(db.close)
+        self.assert_migrated(db)
+    
+    def test_resumes_interrupted_migration(self):
+        # What an interrupted older migration left: the legacy tables renamed
+        # to *_hex (autocommitted) and the new integer tables created empty
+        conn = self.write_legacy_db(99)
+        conn.execute('ALTER TABLE pool_scanned RENAME TO pool_scanned_hex')
+        conn.execute('ALTER TABLE my_scanned RENAME TO my_scanned_hex')
+        conn.execute('CREATE TABLE pool_scanned (start_hi INTEGER NOT NULL, start_lo INTEGER NOT NULL, '
+                     'end_hi INTEGER NOT NULL, end_lo INTEGER NOT NULL, scraped_at TEXT, '
+                     'PRIMARY KEY (start_hi, start_lo))')
+        conn.execute('CREATE TABLE my_scanned (start_hi INTEGER NOT NULL, start_lo INTEGER NOT NULL, '
+                     'end_hi INTEGER NOT NULL, end_lo INTEGER NOT NULL, scanned_at TEXT, '
+                     'keys_checked INTEGER, PRIMARY KEY (start_hi, start_lo))')
+        conn.commit()
+        conn.close()
+        
+        db = coordinator.ScanDatabase(99)
+        self.addCleanup(db.close)
+        self.assert_migrated(db)
+    
+    def test_failed_migration_rolls_back(self):
+        self.write_legacy_db(99).close()
+        
+        # Fail after the legacy tables are dropped and the new ones created
+        original = coordinator.ScanDatabase.INSERT_MY_SQL
+        coordinator.ScanDatabase.INSERT_MY_SQL = 'INSERT INTO no_such_table VALUES (?, ?, ?, ?, ?, ?)'
+        try:
+            with self.assertRaises(sqlite3.Error):
+                coordinator.ScanDatabase(99)
+        finally:
+            coordinator.ScanDatabase.INSERT_MY_SQL = original
+        
+        db = coordinator.ScanDatabase(99)
+        self.addCleanup(db.close)
+        self.assert_migrated(db)
+
+
+if __name__ == '__main__':
+    unittest.main()